@@ -22,8 +22,9 @@ Usage:
 """
 
 import logging
-from typing import List, Dict, Optional, Any, Tuple
-from dataclasses import dataclass, field
+import sys
+from typing import List, Dict, Optional, Any, Union
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 from cc_dictionary import CCDictionary
@@ -31,6 +32,14 @@ from cc_dictionary import CCDictionary
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of memoized character translations per strategy.
+# Chinese text is heavily skewed toward a few thousand common characters, so
+# once full the cache simply stops admitting new keys.
+CHARACTER_CACHE_SIZE = 8192
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # ============================================================================
 # Data Models
@@ -40,11 +49,28 @@ class DefinitionStrategy(Enum):
     """Strategies for selecting primary definition from multiple options."""
     FIRST = "first"           # Use first definition (default, simplest)
     SHORTEST = "shortest"     # Use shortest definition (most concise)
-    MOST_COMMON = "common"    # Use most common English words (future enhancement)
-    CONTEXT_AWARE = "context" # Based on surrounding characters (future enhancement)
+    MOST_COMMON = "common"    # Reserved; currently selects the same as FIRST
+    CONTEXT_AWARE = "context" # Reserved; currently selects the same as FIRST
+
+
+# Strategy lookup by value string (avoids Enum value resolution and the
+# ValueError path for unknown names)
+_STRATEGY_BY_NAME: Dict[str, DefinitionStrategy] = {s.value: s for s in DefinitionStrategy}
 
+# Every character for which str.isspace() is true (ASCII and Latin-1 spaces,
+# the U+2000 block, U+3000 ideographic space, ...). Membership is one set
+# probe and, for single characters, also covers the old "not char.strip()".
+_WHITESPACE = frozenset(
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
 
-@dataclass
+# Strategies whose primary definition maps are built when the translator starts
+_PRECOMPUTED_STRATEGIES = (DefinitionStrategy.FIRST, DefinitionStrategy.SHORTEST)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TranslationCandidate:
     """
     Represents a single translation candidate for a character.
@@ -63,7 +89,7 @@ class TranslationCandidate:
         return f"[{status}] #{self.rank}: {self.definition}"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CharacterTranslation:
     """
     Complete translation information for a single character.
@@ -95,7 +121,7 @@ class CharacterTranslation:
         return f"{status} '{self.character}'{pinyin_str} → {self.primary_definition}"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TranslationResult:
     """
     Complete translation result for text with metadata.
@@ -124,28 +150,128 @@ class TranslationResult:
     strategy_used: str = "first"
     translation_source: str = "CC-CEDICT"
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _merged_metadata: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary format compatible with main.py's translator.translate_text() return value.
         
+        The merged metadata is built on the first call; each call returns
+        its own copy, so callers may modify the returned dict freely.
+        
         Returns:
             Dict with keys: translation, unmapped, coverage, metadata
         """
-        return {
-            "translation": self.translation,
-            "unmapped": self.unmapped,
-            "coverage": self.coverage,
-            "metadata": {
+        merged = self._merged_metadata
+        if merged is None:
+            merged = {
                 "translation_source": self.translation_source,
                 "strategy_used": self.strategy_used,
                 "total_characters": self.total_characters,
                 "mapped_characters": self.mapped_characters,
-                **self.metadata
             }
+            merged.update(self.metadata)
+            self._merged_metadata = merged
+        
+        return {
+            "translation": self.translation,
+            "unmapped": self.unmapped,
+            "coverage": self.coverage,
+            "metadata": dict(merged)
         }
 
 
+def _select_primary_definition(
+    definitions: List[str],
+    strategy: DefinitionStrategy
+) -> str:
+    """
+    Pure strategy selection behind CCDictionaryTranslator.select_primary_definition.
+    
+    Expects at least two definitions.
+    """
+    if strategy == DefinitionStrategy.SHORTEST:
+        # Shortest definition is typically most concise. Manual scan
+        # instead of min(key=len) to avoid a key call per element; the
+        # first of equally short definitions wins, as with min().
+        best = definitions[0]
+        best_len = len(best)
+        for definition in definitions:
+            definition_len = len(definition)
+            if definition_len < best_len:
+                best = definition
+                best_len = definition_len
+                if definition_len <= 1:
+                    # CC-CEDICT definitions are non-empty; nothing shorter
+                    break
+        return best
+    
+    elif strategy in (DefinitionStrategy.MOST_COMMON, DefinitionStrategy.CONTEXT_AWARE):
+        # Accepted for API compatibility but not implemented: neither has
+        # the word-frequency or surrounding-text input it would need, so
+        # both select the same definition as FIRST
+        return definitions[0]
+    
+    else:
+        logger.warning("Unknown strategy: %s, using FIRST", strategy)
+        return definitions[0]
+
+
+def _ascii_translation(char: str) -> CharacterTranslation:
+    """Passthrough result for a non-whitespace ASCII character."""
+    return CharacterTranslation(
+        character=char,
+        primary_definition=char,
+        found_in_dictionary=False
+    )
+
+
+def _copy_translation(translation: CharacterTranslation) -> CharacterTranslation:
+    """Copy a memoized result so callers cannot modify the cached one."""
+    return replace(
+        translation,
+        all_definitions=list(translation.all_definitions),
+        candidates=[replace(candidate) for candidate in translation.candidates]
+    )
+
+
+def _build_candidates(definitions: List[str], primary_def: str) -> List[TranslationCandidate]:
+    """Build the ranked candidate list for a character's definitions."""
+    return [
+        TranslationCandidate(
+            definition=defn,
+            rank=i,
+            selected=(defn == primary_def)
+        )
+        for i, defn in enumerate(definitions)
+    ]
+
+
+class _TranslationTable(dict):
+    """
+    str.translate() table mapping codepoints to "<definition> " strings.
+    
+    Every character maps to its output part plus one trailing separator, so
+    text.translate(table)[:-1] equals the " ".join() of per-character parts.
+    Characters missing from the table (unmapped or whitespace) are resolved
+    in __missing__ and cached, up to CHARACTER_CACHE_SIZE of them so that
+    arbitrary input cannot grow the table without bound.
+    """
+    
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self._size_limit = len(self) + CHARACTER_CACHE_SIZE
+    
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        value = "  " if char in _WHITESPACE else char + " "
+        if len(self) < self._size_limit:
+            self[codepoint] = value
+        return value
+
+
 # ============================================================================
 # CC-CEDICT Translator Class
 # ============================================================================
@@ -171,6 +297,25 @@ class CCDictionaryTranslator:
         print(result.coverage)      # 100.0
     """
     
+    # Statistics live in plain integer slots (attribute increments are cheaper
+    # than dict subscripts); get_stats() assembles the dict on request.
+    __slots__ = (
+        "cc_dictionary",
+        "_dict_size",
+        "_ascii_headwords",
+        "_default_strategy",
+        "_default_strategy_value",
+        "_char_cache",
+        "_primary_maps",
+        "_translate_tables",
+        "_total_translations",
+        "_total_characters",
+        "_mapped_characters",
+        "_unmapped_characters",
+        "_cache_hits",
+        "_cache_misses",
+    )
+    
     def __init__(
         self,
         cc_dictionary: Optional[CCDictionary],
@@ -191,35 +336,69 @@ class CCDictionaryTranslator:
             # Don't raise error - allow initialization for fallback logic
         
         self.cc_dictionary = cc_dictionary
-        self.default_strategy = default_strategy
+        # Entry count, read once: the dictionary is not modified after loading
+        self._dict_size = len(cc_dictionary) if cc_dictionary is not None else 0
+        # ASCII characters with their own entry; every other ASCII character
+        # is passed through by _ascii_translation() without a lookup
+        self._ascii_headwords = frozenset(
+            char for char in map(chr, range(0x80))
+            if char not in _WHITESPACE and char in cc_dictionary.data
+        ) if cc_dictionary is not None else frozenset()
+        self.default_strategy = default_strategy  # also caches its value string
+        
+        # Memoized dictionary-backed translations: strategy value -> char -> result.
+        # Keyed by the value string because Enum.__hash__ runs in Python,
+        # while str hashes are cached on the object.
+        self._char_cache: Dict[str, Dict[str, CharacterTranslation]] = {}
+        # Single character -> primary definition, per strategy
+        self._primary_maps: Dict[DefinitionStrategy, Dict[str, str]] = {}
+        # str.translate() tables derived from the primary maps, per strategy
+        self._translate_tables: Dict[DefinitionStrategy, _TranslationTable] = {}
         
         # Statistics
-        self._stats = {
-            "total_translations": 0,
-            "total_characters": 0,
-            "mapped_characters": 0,
-            "unmapped_characters": 0,
-            "cache_hits": 0,
-            "cache_misses": 0
-        }
+        self._reset_counters()
+        
+        # FIRST and SHORTEST are fixed per character, so resolve them once
+        # up front
+        if cc_dictionary is not None:
+            for strategy in _PRECOMPUTED_STRATEGIES:
+                self._get_primary_map(strategy)
         
         logger.info(
             "CCDictionaryTranslator initialized with %s entries (strategy: %s)",
-            len(cc_dictionary) if cc_dictionary else 0,
-            default_strategy.value
+            self._dict_size,
+            self._default_strategy_value
         )
     
+    @property
+    def default_strategy(self) -> DefinitionStrategy:
+        """Strategy used when a call does not pass one."""
+        return self._default_strategy
+    
+    @default_strategy.setter
+    def default_strategy(self, strategy: DefinitionStrategy) -> None:
+        self._default_strategy = strategy
+        self._default_strategy_value = strategy.value
+    
     def translate_character(
         self,
         char: str,
-        strategy: Optional[DefinitionStrategy] = None
+        strategy: Optional[DefinitionStrategy] = None,
+        include_candidates: bool = True
     ) -> CharacterTranslation:
         """
         Translate a single Chinese character to English.
         
+        Dictionary-backed results are memoized per (character, strategy);
+        each call returns its own copy of the memoized result, so callers
+        may modify it without affecting later lookups.
+        
         Args:
             char: Single Chinese character to translate
             strategy: Definition selection strategy (uses default if None)
+            include_candidates: Build the ranked TranslationCandidate list.
+                When False, candidates may be empty; a later call that asks
+                for them gets the list built.
             
         Returns:
             CharacterTranslation object with all translation information
@@ -229,7 +408,7 @@ class CCDictionaryTranslator:
             print(translation.primary_definition)  # "good"
             print(translation.all_definitions)      # ["good", "well", "proper", ...]
         """
-        self._stats["total_characters"] += 1
+        self._total_characters += 1
         
         if not char or len(char) != 1:
             logger.warning("Invalid character for translation: %r (length: %d)", char, len(char) if char else 0)
@@ -240,7 +419,7 @@ class CCDictionaryTranslator:
             )
         
         # Handle whitespace and special characters
-        if char.isspace() or not char.strip():
+        if char in _WHITESPACE:
             return CharacterTranslation(
                 character=char,
                 primary_definition=" ",
@@ -256,12 +435,62 @@ class CCDictionaryTranslator:
                 found_in_dictionary=False
             )
         
-        # Look up character in CC-CEDICT
-        entry = self.cc_dictionary.lookup_character(char)
+        # ASCII without a dictionary entry: passthrough without a lookup
+        if char < "\x80" and char not in self._ascii_headwords:
+            self._unmapped_characters += 1
+            return _ascii_translation(char)
+        
+        if strategy is None:
+            strategy_to_use = self._default_strategy
+            strategy_value = self._default_strategy_value
+        else:
+            strategy_to_use = strategy
+            strategy_value = strategy.value
+        strategy_cache = self._char_cache.get(strategy_value)
+        if strategy_cache is None:
+            strategy_cache = self._char_cache[strategy_value] = {}
+        cached = strategy_cache.get(char)
+        if cached is not None:
+            self._cache_hits += 1
+            if cached.found_in_dictionary:
+                self._mapped_characters += 1
+                if include_candidates and not cached.candidates:
+                    cached = strategy_cache[char] = replace(
+                        cached,
+                        candidates=_build_candidates(
+                            cached.all_definitions, cached.primary_definition
+                        )
+                    )
+            else:
+                self._unmapped_characters += 1
+            return _copy_translation(cached)
+        
+        self._cache_misses += 1
+        translation = self._translate_character_uncached(
+            char, strategy_to_use, include_candidates
+        )
+        if len(strategy_cache) < CHARACTER_CACHE_SIZE:
+            strategy_cache[char] = translation
+            return _copy_translation(translation)
+        return translation
+    
+    def _translate_character_uncached(
+        self,
+        char: str,
+        strategy_to_use: DefinitionStrategy,
+        include_candidates: bool = True
+    ) -> CharacterTranslation:
+        """
+        Build the CharacterTranslation for a valid, non-space character.
+        
+        Updates the mapped/unmapped counters; called on cache misses only.
+        """
+        # Look up character in CC-CEDICT once; all fields come from the entry
+        entry = self.cc_dictionary.lookup(char)
         
-        if entry is None:
+        if entry is None or not entry.definitions:
             # Character not found in dictionary
-            self._stats["unmapped_characters"] += 1
+            self._unmapped_characters += 1
             logger.debug("Character not in CC-CEDICT: %s", char)
             return CharacterTranslation(
                 character=char,
@@ -270,35 +499,23 @@ class CCDictionaryTranslator:
             )
         
         # Character found - extract information
-        self._stats["mapped_characters"] += 1
+        self._mapped_characters += 1
         
-        # Get definitions
-        definitions = self.cc_dictionary.get_definitions(char)
-        if not definitions:
-            definitions = [char]  # Fallback
-        
-        # Get pinyin
-        pinyin = self.cc_dictionary.get_pinyin(char)
-        
-        # Get traditional/simplified forms
-        # Note: get_traditional() expects simplified char, returns traditional
-        # get_simplified() expects traditional char, returns simplified
-        traditional = self.cc_dictionary.get_traditional(char) if char else None
-        simplified = self.cc_dictionary.get_simplified(char) if char else None
-        
-        # Select primary definition
-        strategy_to_use = strategy or self.default_strategy
-        primary_def = self.select_primary_definition(definitions, strategy_to_use)
-        
-        # Create candidates list
-        candidates = [
-            TranslationCandidate(
-                definition=defn,
-                rank=i,
-                selected=(defn == primary_def)
-            )
-            for i, defn in enumerate(definitions)
-        ]
+        definitions = entry.definitions
+        pinyin = entry.pinyin
+        
+        # The key is the simplified form; traditional comes from the entry
+        traditional = entry.traditional
+        simplified = entry.simplified
+        
+        # Select primary definition (precomputed for the common strategies)
+        primary_map = self._primary_maps.get(strategy_to_use)
+        primary_def = primary_map.get(char) if primary_map is not None else None
+        if primary_def is None:
+            primary_def = self.select_primary_definition(definitions, strategy_to_use)
+        
+        # Create candidates list (only when requested)
+        candidates = _build_candidates(definitions, primary_def) if include_candidates else []
         
         return CharacterTranslation(
             character=char,
@@ -333,8 +550,8 @@ class CCDictionaryTranslator:
         Strategies:
             FIRST: Use first definition (default, most common meaning)
             SHORTEST: Use shortest definition (most concise)
-            MOST_COMMON: Use definition with most common English words (future)
-            CONTEXT_AWARE: Use surrounding context (future)
+            MOST_COMMON: Falls back to FIRST (not implemented)
+            CONTEXT_AWARE: Falls back to FIRST (not implemented)
         """
         if not definitions:
             return ""
@@ -342,36 +559,18 @@ class CCDictionaryTranslator:
         if len(definitions) == 1:
             return definitions[0]
         
-        # Strategy implementations
-        if strategy == DefinitionStrategy.FIRST:
+        if strategy is DefinitionStrategy.FIRST:
             # First definition is typically the most common/primary meaning
             return definitions[0]
         
-        elif strategy == DefinitionStrategy.SHORTEST:
-            # Shortest definition is typically most concise
-            return min(definitions, key=len)
-        
-        elif strategy == DefinitionStrategy.MOST_COMMON:
-            # TODO: Implement based on English word frequency
-            # For now, fall back to FIRST
-            logger.debug("MOST_COMMON strategy not yet implemented, using FIRST")
-            return definitions[0]
-        
-        elif strategy == DefinitionStrategy.CONTEXT_AWARE:
-            # TODO: Implement based on surrounding characters
-            # For now, fall back to FIRST
-            logger.debug("CONTEXT_AWARE strategy not yet implemented, using FIRST")
-            return definitions[0]
-        
-        else:
-            logger.warning("Unknown strategy: %s, using FIRST", strategy)
-            return definitions[0]
+        return _select_primary_definition(definitions, strategy)
     
     def translate_text(
         self,
         text: str,
         glyphs: Optional[List[Any]] = None,
-        strategy: Optional[DefinitionStrategy] = None
+        strategy: Optional[DefinitionStrategy] = None,
+        include_details: bool = True
     ) -> TranslationResult:
         """
         Translate Chinese text to English.
@@ -383,6 +582,16 @@ class CCDictionaryTranslator:
             text: Chinese text to translate
             glyphs: Optional list of Glyph objects (for compatibility, not used in translation logic)
             strategy: Definition selection strategy (uses default if None)
+            include_details: If True, character_translations holds one
+                CharacterTranslation per character. Their candidates lists
+                are empty unless already built by an earlier
+                translate_character() call, since text translation never
+                reads them; call translate_character() for a character's
+                ranked candidates. If False, skip
+                building per-character
+                CharacterTranslation objects and translate from a flat
+                character -> primary definition map instead
+                (character_translations is left empty).
             
         Returns:
             TranslationResult object with translation and metadata
@@ -393,7 +602,7 @@ class CCDictionaryTranslator:
             print(result.coverage)      # 100.0
             print(result.unmapped)      # []
         """
-        self._stats["total_translations"] += 1
+        self._total_translations += 1
         
         logger.info("Translating text: %r (length: %d)", text[:50], len(text))
         
@@ -405,54 +614,183 @@ class CCDictionaryTranslator:
                 coverage=0.0
             )
         
-        strategy_to_use = strategy or self.default_strategy
-        
-        # Translate each character
-        char_translations = []
-        for char in text:
-            char_trans = self.translate_character(char, strategy_to_use)
-            char_translations.append(char_trans)
+        strategy_to_use = strategy or self._default_strategy
+        
+        # Single pass per path: build the output and all counters together
+        unmapped_set = set()
+        total_unmapped = 0
+        total_chars = 0
+        mapped_chars = 0
+        
+        if include_details or self.cc_dictionary is None:
+            # Translate each character
+            # Pass the caller's strategy through: None lets translate_character
+            # use the cached default value instead of reading .value per char
+            char_translations = self._translate_characters(text, strategy)
+            # One output slot per character, filled in place
+            translation_parts: List[Optional[str]] = [None] * len(char_translations)
+            for i, ct in enumerate(char_translations):
+                translation_parts[i] = ct.primary_definition
+                if ct.found_in_dictionary:
+                    mapped_chars += 1
+                elif ct.character not in _WHITESPACE:
+                    total_unmapped += 1
+                    unmapped_set.add(ct.character)
+            total_chars = mapped_chars + total_unmapped
+        else:
+            # Fast path: one dict lookup per character, no per-character
+            # objects. The map holds no whitespace, so the common mapped
+            # case costs a single lookup and the whitespace check only runs
+            # for characters the map misses. Iterating the str directly is
+            # deliberate: every mapped character still needs its definition
+            # string for the join, so converting to a codepoint array first
+            # only adds a pass.
+            char_translations = []
+            translation_parts = []
+            append_part = translation_parts.append
+            get_definition = self._get_primary_map(strategy_to_use).get
+            add_unmapped = unmapped_set.add
+            whitespace = _WHITESPACE
+            for c in text:
+                definition = get_definition(c)
+                if definition is not None:
+                    append_part(definition)
+                    mapped_chars += 1
+                elif c in whitespace:
+                    append_part(" ")
+                else:
+                    append_part(c)
+                    total_unmapped += 1
+                    add_unmapped(c)
+            total_chars = mapped_chars + total_unmapped
+            self._total_characters += len(text)
+            self._mapped_characters += mapped_chars
+            self._unmapped_characters += total_unmapped
         
-        # Build translation string
-        translation_parts = [ct.primary_definition for ct in char_translations]
         translation = " ".join(translation_parts)
         
-        # Identify unmapped characters
-        unmapped = [
-            ct.character
-            for ct in char_translations
-            if not ct.found_in_dictionary and not ct.character.isspace()
-        ]
-        
         # Calculate coverage
-        total_chars = len([c for c in text if not c.isspace()])
-        mapped_chars = len([ct for ct in char_translations if ct.found_in_dictionary])
         coverage = (mapped_chars / total_chars * 100.0) if total_chars > 0 else 0.0
         
         result = TranslationResult(
             original_text=text,
             translation=translation,
             character_translations=char_translations,
-            unmapped=list(set(unmapped)),  # Remove duplicates
+            unmapped=list(unmapped_set),
             coverage=coverage,
             total_characters=total_chars,
             mapped_characters=mapped_chars,
             strategy_used=strategy_to_use.value,
             translation_source="CC-CEDICT",
             metadata={
-                "dictionary_entries": len(self.cc_dictionary) if self.cc_dictionary else 0,
-                "unique_unmapped": len(set(unmapped)),
-                "total_unmapped": len(unmapped)
+                "dictionary_entries": self._dict_size,
+                "unique_unmapped": len(unmapped_set),
+                "total_unmapped": total_unmapped
             }
         )
         
         logger.info(
             "Translation complete: %d/%d characters mapped (%.1f%% coverage), %d unique unmapped",
-            mapped_chars, total_chars, coverage, len(set(unmapped))
+            mapped_chars, total_chars, coverage, len(unmapped_set)
         )
         
         return result
     
+    def _translate_characters(
+        self,
+        text: str,
+        strategy: Optional[DefinitionStrategy]
+    ) -> List[CharacterTranslation]:
+        """
+        Translate every character of text (the per-character hot loop).
+        
+        Kept as a single isolated function so the loop body stays minimal:
+        the bound method is resolved once and the list is built by a
+        comprehension rather than repeated append calls. Candidate lists
+        are not built here; text translation never reads them.
+        
+        Args:
+            text: Text to translate character by character
+            strategy: Definition selection strategy (uses default if None)
+            
+        Returns:
+            One CharacterTranslation per character, in order
+        """
+        translate_character = self.translate_character
+        return [translate_character(char, strategy, False) for char in text]
+    
+    def _get_primary_map(self, strategy: DefinitionStrategy) -> Dict[str, str]:
+        """
+        Get the single character -> primary definition map for a strategy.
+        
+        Built from the dictionary's single-character entries (~11k), which
+        are the only keys per-character translation can hit. Whitespace is
+        never included. Characters absent from the map are unmapped.
+        
+        A dict keyed by the character is kept over a dense list indexed by
+        codepoint (e.g. the U+4E00..U+9FFF block): in CPython the ord() call,
+        range check and index cost more than one str-keyed dict.get().
+        """
+        primary_map = self._primary_maps.get(strategy)
+        if primary_map is None:
+            select = self.select_primary_definition
+            data = self.cc_dictionary.data
+            primary_map = {}
+            for key in data:
+                if len(key) == 1 and key not in _WHITESPACE:
+                    definitions = data[key].definitions
+                    if definitions:
+                        primary_map[key] = select(definitions, strategy)
+            self._primary_maps[strategy] = primary_map
+            logger.debug(
+                "Primary definition map built for strategy %s: %d characters",
+                strategy.value, len(primary_map)
+            )
+        return primary_map
+    
+    def translate_text_fast(
+        self,
+        text: str,
+        strategy: Optional[DefinitionStrategy] = None
+    ) -> str:
+        """
+        Translate text to the space-separated definition string only.
+        
+        Produces the same string as translate_text(text).translation, but
+        runs the per-character mapping inside str.translate() and builds no
+        result objects. Statistics are not updated.
+        
+        Args:
+            text: Chinese text to translate
+            strategy: Definition selection strategy (uses default if None)
+            
+        Returns:
+            Translation string
+        """
+        if not text:
+            return ""
+        if self.cc_dictionary is None:
+            return " ".join(text)
+        
+        strategy_to_use = strategy or self._default_strategy
+        table = self._translate_tables.get(strategy_to_use)
+        if table is None:
+            table = _TranslationTable(
+                (ord(char), definition + " ")
+                for char, definition in self._get_primary_map(strategy_to_use).items()
+            )
+            self._translate_tables[strategy_to_use] = table
+        
+        # Drop the separator appended after the last character
+        return text.translate(table)[:-1]
+    
+    def clear_cache(self) -> None:
+        """Clear the memoized character translations and primary maps."""
+        self._char_cache.clear()
+        self._primary_maps.clear()
+        self._translate_tables.clear()
+        logger.debug("Character translation cache cleared")
+    
     def get_translation_metadata(self) -> Dict[str, Any]:
         """
         Get translator metadata and statistics.
@@ -466,9 +804,9 @@ class CCDictionaryTranslator:
         """
         return {
             "translation_source": "CC-CEDICT",
-            "dictionary_size": len(self.cc_dictionary) if self.cc_dictionary else 0,
-            "default_strategy": self.default_strategy.value,
-            "statistics": self._stats.copy(),
+            "dictionary_size": self._dict_size,
+            "default_strategy": self._default_strategy_value,
+            "statistics": self.get_stats(),
             "available_strategies": [s.value for s in DefinitionStrategy]
         }
     
@@ -479,20 +817,29 @@ class CCDictionaryTranslator:
         Returns:
             Dictionary with translation statistics
         """
-        return self._stats.copy()
+        return {
+            "total_translations": self._total_translations,
+            "total_characters": self._total_characters,
+            "mapped_characters": self._mapped_characters,
+            "unmapped_characters": self._unmapped_characters,
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses
+        }
     
     def reset_stats(self) -> None:
         """Reset translation statistics."""
-        self._stats = {
-            "total_translations": 0,
-            "total_characters": 0,
-            "mapped_characters": 0,
-            "unmapped_characters": 0,
-            "cache_hits": 0,
-            "cache_misses": 0
-        }
+        self._reset_counters()
         logger.info("Translation statistics reset")
     
+    def _reset_counters(self) -> None:
+        """Zero the statistics counters."""
+        self._total_translations = 0
+        self._total_characters = 0
+        self._mapped_characters = 0
+        self._unmapped_characters = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
     def log_translation_stats(self, level: str = "info") -> None:
         """
         Log detailed translation statistics for monitoring and debugging.
@@ -517,16 +864,15 @@ class CCDictionaryTranslator:
             mapped_chars,
             unmapped_chars,
             coverage_rate,
-            self.default_strategy.value
+            self._default_strategy_value
         )
     
     def __repr__(self) -> str:
-        dict_size = len(self.cc_dictionary) if self.cc_dictionary else 0
-        return f"CCDictionaryTranslator(entries={dict_size:,}, strategy={self.default_strategy.value})"
+        return f"CCDictionaryTranslator(entries={self._dict_size:,}, strategy={self._default_strategy_value})"
     
     def __len__(self) -> int:
         """Return number of dictionary entries."""
-        return len(self.cc_dictionary) if self.cc_dictionary else 0
+        return self._dict_size
 
 
 # ============================================================================
@@ -535,7 +881,7 @@ class CCDictionaryTranslator:
 
 def create_translator(
     cc_dictionary: CCDictionary,
-    strategy: str = "first"
+    strategy: Union[str, DefinitionStrategy] = "first"
 ) -> CCDictionaryTranslator:
     """
     Factory function to create CCDictionaryTranslator with string strategy.
@@ -543,6 +889,7 @@ def create_translator(
     Args:
         cc_dictionary: CCDictionary instance
         strategy: Strategy name as string ("first", "shortest", "common", "context")
+            or a DefinitionStrategy member
         
     Returns:
         Configured CCDictionaryTranslator instance
@@ -550,9 +897,11 @@ def create_translator(
     Example:
         translator = create_translator(cc_dict, strategy="shortest")
     """
-    try:
-        strategy_enum = DefinitionStrategy(strategy)
-    except ValueError:
+    if isinstance(strategy, DefinitionStrategy):
+        strategy_enum = strategy
+    else:
+        strategy_enum = _STRATEGY_BY_NAME.get(strategy)
+    if strategy_enum is None:
         logger.warning("Invalid strategy: %s, using 'first'", strategy)
         strategy_enum = DefinitionStrategy.FIRST
     
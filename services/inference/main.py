@@ -6,17 +6,79 @@ Run with:
   uvicorn services.inference.main:app --host 0.0.0.0 --port 8001
 """
 
+import asyncio
+import functools
+import hashlib
+import importlib.metadata
 import io
+import json
 import logging
-from typing import List, Optional, Tuple, Dict, Any
-from concurrent.futures import ThreadPoolExecutor
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import List, Optional, Tuple, Dict, Any, BinaryIO, Union
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from PIL import Image, ImageEnhance
 import numpy as np
+
+# Cap OpenMP/MKL threads per OCR engine before torch (via easyocr) and
+# paddle are imported; both engines run concurrently, and multiple uvicorn
+# workers would otherwise each spawn cpu_count() threads. Explicit
+# OMP_NUM_THREADS / MKL_NUM_THREADS settings take precedence.
+def _ocr_thread_default() -> int:
+    """
+    Threads per OCR engine from OCR_NUM_THREADS (default: half the CPUs).
+    
+    Values that do not parse as an integer fall back to the default; the
+    result is at least 1.
+    """
+    default = max(1, (os.cpu_count() or 2) // 2)
+    try:
+        threads = int(os.getenv("OCR_NUM_THREADS", default))
+    except ValueError:
+        return default
+    return max(1, threads)
+
+
+OCR_NUM_THREADS = _ocr_thread_default()
+os.environ.setdefault("OMP_NUM_THREADS", str(OCR_NUM_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(OCR_NUM_THREADS))
+
+
+def _omp_thread_count() -> int:
+    """
+    Thread count for torch's intra-op pool, taken from OMP_NUM_THREADS.
+    
+    OpenMP also accepts a per-nesting-level list ("4,2"); the first level is
+    the one torch uses. Values that do not parse to a positive integer fall
+    back to OCR_NUM_THREADS.
+    """
+    first_level = os.environ.get("OMP_NUM_THREADS", "").split(",", 1)[0].strip()
+    try:
+        threads = int(first_level)
+    except ValueError:
+        return OCR_NUM_THREADS
+    return threads if threads > 0 else OCR_NUM_THREADS
+
+
 import easyocr
+import torch
+
+torch.set_num_threads(_omp_thread_count())
+try:
+    torch.set_num_interop_threads(1)
+except RuntimeError:
+    # Already fixed once inter-op work has started (e.g. on reload)
+    pass
 
 from translator import get_translator
 from sentence_translator import get_sentence_translator
@@ -25,6 +87,19 @@ from cc_dictionary import CCDictionary
 from cc_translation import CCDictionaryTranslator, DefinitionStrategy
 from marian_adapter import get_marian_adapter  # Phase 5: MarianMT adapter layer
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import OCR fusion module
 from ocr_fusion import (
     NormalizedOCRResult,
@@ -41,7 +116,8 @@ import sys
 from pathlib import Path
 # Add parent directory to path for preprocessing module
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from preprocessing.image_preprocessing import preprocess_image
+from preprocessing.image_preprocessing import preprocess_image, CV2_AVAILABLE as PREPROCESSING_CV2_AVAILABLE
+from preprocessing.config import get_config_summary as get_preprocessing_config_summary
 
 # Configure logging
 logging.basicConfig(
@@ -50,7 +126,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Rune-X Handwriting OCR")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the OCR engines before the server accepts requests."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, _warm_up_ocr_engines)
+    if OCR_CACHE_DIR:
+        await loop.run_in_executor(None, _prune_disk_cache)
+    yield
+
+
+# orjson serializes the glyph-heavy responses several times faster than
+# the stdlib json encoder behind JSONResponse
+app = FastAPI(
+    title="Rune-X Handwriting OCR",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -64,9 +157,63 @@ app.add_middleware(
 MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_IMAGE_DIMENSION = 4000  # Max width or height
 MIN_IMAGE_DIMENSION = 50  # Min width or height
-OCR_TIMEOUT = 30  # seconds
+OCR_TIMEOUT = 30  # seconds, per engine, counted from when the engine starts the job
+OCR_REQUEST_TIMEOUT = 60  # seconds a request waits for all OCR engines, queueing included
+OCR_ENGINE_QUEUE_SIZE = 4  # Jobs per OCR engine (running + waiting) before requests get a 503
+EASYOCR_BATCH_SIZE = 8  # Detected text boxes recognized per EasyOCR recognizer forward pass
+OCR_WARMUP_SIZE = 640  # Side of the blank frame run through each engine at startup
+OCR_CACHE_SIZE = 256  # Fused OCR results kept for repeated uploads (0 disables)
+# Optional directory persisting the OCR cache across workers and restarts
+# (unset disables). Entries live in one subdirectory per engine/config
+# namespace (see _disk_cache_dir); stale namespaces are removed at startup
+OCR_CACHE_DIR = os.getenv("OCR_CACHE_DIR")
+OCR_DISK_CACHE_MAX_ENTRIES = 10000  # Most recently used files kept per namespace
+OCR_CACHE_FORMAT_VERSION = 2  # Bump when the cached OCR tuple or fusion output changes
+RESPONSE_CACHE_SIZE = 128  # Complete responses kept for repeated uploads (0 disables)
 SUPPORTED_FORMATS = {'image/jpeg', 'image/jpg', 'image/png', 'image/webp'}
 
+# Failures an OCR engine may raise on a bad or unusual image; anything else
+# propagates out of run_easyocr/run_paddleocr to _recognize_image
+OCR_ENGINE_ERRORS = (RuntimeError, ValueError, TypeError, IndexError, MemoryError)
+
+# EasyOCR readtext settings, fixed at import (read-only)
+EASYOCR_READTEXT_KWARGS = MappingProxyType({
+    "detail": 1,
+    "width_ths": 0.2,
+    "height_ths": 0.2,
+    "paragraph": False,
+    "batch_size": EASYOCR_BATCH_SIZE,
+})
+
+# LRU cache of fused OCR output keyed by image digest (see _get_cached_ocr)
+_ocr_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+
+# LRU cache of complete responses keyed by the same digest. It lives only in
+# this process, and the dictionaries, models and preprocessing config are
+# loaded once at import and never reloaded, so within its lifetime the image
+# alone determines the response; no version needs to be part of the key
+# (guarded by _ocr_cache_lock)
+_response_cache: "OrderedDict[bytes, InferenceResponse]" = OrderedDict()
+_DIGEST_CHUNK_SIZE = 1 << 20  # Bytes read per step when hashing an upload
+
+# One long-lived thread per OCR engine. Torch and paddle release the GIL
+# during inference, so the engines run concurrently, while each reader is
+# only ever entered from its own thread: concurrent requests queue per
+# engine, so request K+1's EasyOCR pass overlaps request K's PaddleOCR pass
+# instead of two threads contending for the same (non thread-safe) reader.
+_easyocr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="easyocr")
+_paddleocr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="paddleocr")
+# Admission slots bounding each engine's backlog (see _submit_ocr)
+_easyocr_slots = threading.BoundedSemaphore(OCR_ENGINE_QUEUE_SIZE)
+_paddleocr_slots = threading.BoundedSemaphore(OCR_ENGINE_QUEUE_SIZE)
+
+# Neural translation stage (MarianMT, Qwen) runs on its own single thread:
+# requests queue here in order while the next request's preprocessing and
+# OCR proceed on the default executor, and the models never see concurrent
+# generate() calls
+_translation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="translate")
+
 
 class InferenceResponse(BaseModel):
     text: str
@@ -93,7 +240,9 @@ def _load_easyocr() -> Optional[easyocr.Reader]:
     """
     try:
         logger.info("Attempting to initialize EasyOCR (langs=['ch_sim', 'en'])...")
-        reader = easyocr.Reader(['ch_sim', 'en'], gpu=False)
+        # quantize=True: on CPU, EasyOCR applies INT8 dynamic quantization
+        # (torch.quantization.quantize_dynamic) to its models at load time
+        reader = easyocr.Reader(['ch_sim', 'en'], gpu=False, quantize=True)
         logger.info("EasyOCR initialized successfully with ch_sim and en")
         return reader
     except Exception as e:
@@ -102,7 +251,7 @@ def _load_easyocr() -> Optional[easyocr.Reader]:
         logger.debug(traceback.format_exc())
         try:
             logger.info("Fallback: Trying EasyOCR with ch_sim only...")
-            reader = easyocr.Reader(['ch_sim'], gpu=False)
+            reader = easyocr.Reader(['ch_sim'], gpu=False, quantize=True)
             logger.info("EasyOCR initialized successfully with ch_sim only")
             return reader
         except Exception as e2:
@@ -165,7 +314,7 @@ def _load_paddleocr():
 # ============================================================================
 
 
-def _preprocess_image(image_bytes: bytes) -> Tuple[np.ndarray, Image.Image]:
+def _preprocess_image(image_bytes: Union[bytes, BinaryIO]) -> Tuple[np.ndarray, Tuple[int, int]]:
     """
     Preprocess image for better OCR results using modular preprocessing system.
     
@@ -173,10 +322,10 @@ def _preprocess_image(image_bytes: bytes) -> Tuple[np.ndarray, Image.Image]:
     located in services/preprocessing/image_preprocessing.py
     
     Args:
-        image_bytes: Raw image bytes
+        image_bytes: Raw image bytes, or a binary file object at the image start
         
     Returns:
-        Tuple of (numpy array for OCR, PIL Image for metadata)
+        Tuple of (numpy array for OCR, (width, height) of the preprocessed image)
         
     Raises:
         HTTPException: If image is invalid or cannot be processed
@@ -191,13 +340,83 @@ def _preprocess_image(image_bytes: bytes) -> Tuple[np.ndarray, Image.Image]:
     # Testing confirmed: Aggressive preprocessing (noise reduction, deskewing, brightness norm)
     # was corrupting handwritten Chinese characters, causing severe OCR accuracy degradation
     # Current configuration provides best results for handwritten text
-    return preprocess_image(
+    img_array, pil_image = preprocess_image(
         image_bytes,
         apply_noise_reduction=False,  # Disabled: Corrupts handwriting
         apply_binarization=False,      # Disabled: Can cause issues
         apply_deskew=False,            # Disabled: Corrupts handwriting
         apply_brightness_norm=False    # Disabled: Corrupts handwriting
     )
+    # Only the size is needed downstream; dropping the PIL copy here frees a
+    # full-resolution RGB buffer before the OCR engines run
+    return img_array, pil_image.size
+
+
+def _bbox_extents(boxes: List[Any]) -> List[List[float]]:
+    """
+    Compute axis-aligned [x1, y1, x2, y2] extents for OCR quadrilaterals.
+    
+    All boxes are stacked into one (n, points, 2) array and reduced with a
+    single min/max over the point axis; ragged input (boxes with differing
+    point counts) falls back to per-box reductions.
+    
+    Args:
+        boxes: Sequence of boxes, each a sequence of [x, y] points
+        
+    Returns:
+        One [x1, y1, x2, y2] list of floats per box
+    """
+    if not boxes:
+        return []
+    try:
+        points = np.asarray(boxes, dtype=np.float64)
+    except (ValueError, TypeError):
+        points = None
+    if points is not None and points.ndim == 3 and points.shape[2] >= 2:
+        points = points[:, :, :2]
+        return np.concatenate((points.min(axis=1), points.max(axis=1)), axis=1).tolist()
+    
+    extents = []
+    for box in boxes:
+        x_coords = [p[0] for p in box]
+        y_coords = [p[1] for p in box]
+        extents.append([
+            float(min(x_coords)), float(min(y_coords)),
+            float(max(x_coords)), float(max(y_coords))
+        ])
+    return extents
+
+
+def _expand_detections(
+    detections: List[Tuple[Any, str, float]],
+    source: str
+) -> List[NormalizedOCRResult]:
+    """
+    Turn parsed OCR detections into per-character normalized results.
+    
+    Shared by run_easyocr and run_paddleocr once each has parsed its
+    engine-specific output format.
+    
+    Args:
+        detections: (box, stripped text, confidence in [0, 1]) per detection
+        source: OCR engine name recorded on each result
+        
+    Returns:
+        List of normalized OCR results, one per character
+    """
+    normalized = []
+    # Extract bounding box coordinates for all detections at once
+    extents = _bbox_extents([box for box, _, _ in detections])
+    for (_, text_str, confidence), (x1, y1, x2, y2) in zip(detections, extents):
+        # For multi-character detections, split and create separate entries
+        # We'll use the same bbox for all characters (will be refined in alignment);
+        # alignment only reads it, so one list is shared by every character
+        bbox = [x1, y1, x2, y2]
+        normalized.extend(
+            NormalizedOCRResult(bbox=bbox, char=char, confidence=confidence, source=source)
+            for char in text_str
+        )
+    return normalized
 
 
 def run_easyocr(ocr_reader: easyocr.Reader, img_array: np.ndarray) -> List[NormalizedOCRResult]:
@@ -214,15 +433,9 @@ def run_easyocr(ocr_reader: easyocr.Reader, img_array: np.ndarray) -> List[Norma
     try:
         # EasyOCR format: [[bbox, text, confidence], ...]
         # bbox format: [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
-        results = ocr_reader.readtext(
-            img_array,
-            detail=1,
-            width_ths=0.2,
-            height_ths=0.2,
-            paragraph=False
-        )
+        results = ocr_reader.readtext(img_array, **EASYOCR_READTEXT_KWARGS)
         
-        normalized = []
+        detections = []
         for det in results:
             if not det or len(det) < 3:
                 continue
@@ -230,42 +443,23 @@ def run_easyocr(ocr_reader: easyocr.Reader, img_array: np.ndarray) -> List[Norma
             box, txt, conf = det
             
             # Skip empty text
-            if not txt or not str(txt).strip():
+            text_str = str(txt).strip() if txt else ""
+            if not text_str:
                 continue
             
-            # Extract bounding box coordinates
             if box and len(box) >= 4:
-                x_coords = [p[0] for p in box]
-                y_coords = [p[1] for p in box]
-                x1 = float(min(x_coords))
-                y1 = float(min(y_coords))
-                x2 = float(max(x_coords))
-                y2 = float(max(y_coords))
-                
                 # Normalize confidence to [0, 1]
                 confidence = float(conf)
                 if confidence > 1.0:
                     confidence = confidence / 100.0
                 confidence = max(0.0, min(1.0, confidence))
-                
-                # Process each character in the detected text
-                text_str = str(txt).strip()
-                # For multi-character detections, split and create separate entries
-                # We'll use the same bbox for all characters (will be refined in alignment)
-                for char in text_str:
-                    normalized.append(
-                        NormalizedOCRResult(
-                            bbox=[x1, y1, x2, y2],
-                            char=char,
-                            confidence=confidence,
-                            source="easyocr"
-                        )
-                    )
+                detections.append((box, text_str, confidence))
         
+        normalized = _expand_detections(detections, "easyocr")
         logger.info("EasyOCR detected %d character(s)", len(normalized))
         return normalized
         
-    except Exception as e:
+    except OCR_ENGINE_ERRORS as e:
         logger.error("EasyOCR processing failed: %s", e)
         return []
 
@@ -288,10 +482,10 @@ def run_paddleocr(ocr_reader, img_array: np.ndarray) -> List[NormalizedOCRResult
         # The cls parameter is only used during initialization (use_angle_cls)
         results = ocr_reader.ocr(img_array)
         
-        normalized = []
         if not results or not results[0]:
-            return normalized
+            return []
         
+        detections = []
         for line in results[0]:
             if not line or len(line) < 2:
                 continue
@@ -325,42 +519,116 @@ def run_paddleocr(ocr_reader, img_array: np.ndarray) -> List[NormalizedOCRResult
                 continue
             
             # Skip empty text
-            if not txt or not str(txt).strip():
+            text_str = str(txt).strip() if txt else ""
+            if not text_str:
                 continue
             
-            # Extract bounding box coordinates
             if box and len(box) >= 4:
-                x_coords = [p[0] for p in box]
-                y_coords = [p[1] for p in box]
-                x1 = float(min(x_coords))
-                y1 = float(min(y_coords))
-                x2 = float(max(x_coords))
-                y2 = float(max(y_coords))
-                
                 # Normalize confidence to [0, 1]
-                confidence = float(conf)
-                confidence = max(0.0, min(1.0, confidence))
-                
-                # Process each character in the detected text
-                text_str = str(txt).strip()
-                for char in text_str:
-                    normalized.append(
-                        NormalizedOCRResult(
-                            bbox=[x1, y1, x2, y2],
-                            char=char,
-                            confidence=confidence,
-                            source="paddleocr"
-                        )
-                    )
+                confidence = max(0.0, min(1.0, float(conf)))
+                detections.append((box, text_str, confidence))
         
+        normalized = _expand_detections(detections, "paddleocr")
         logger.info("PaddleOCR detected %d character(s)", len(normalized))
         return normalized
         
-    except Exception as e:
+    except OCR_ENGINE_ERRORS as e:
         logger.error("PaddleOCR processing failed: %s", e)
         return []
 
 
+def _submit_ocr(
+    executor: ThreadPoolExecutor,
+    slots: threading.BoundedSemaphore,
+    run: Any,
+    ocr_reader: Any,
+    img_array: np.ndarray
+) -> Optional[Tuple[Future, threading.Event]]:
+    """
+    Queue one OCR engine run on the engine's own thread.
+    
+    Each engine admits at most OCR_ENGINE_QUEUE_SIZE jobs (running plus
+    waiting); the slot is released when the job finishes or is cancelled.
+    
+    Args:
+        executor: The engine's single-thread executor
+        slots: The engine's admission semaphore
+        run: run_easyocr or run_paddleocr
+        ocr_reader: Engine instance passed to run
+        img_array: Preprocessed image
+        
+    Returns:
+        (future, started) where started is set once the engine thread picks
+        the job up, or None if the engine's queue is full
+    """
+    if not slots.acquire(blocking=False):
+        return None
+    started = threading.Event()
+    
+    def job() -> List[NormalizedOCRResult]:
+        started.set()
+        return run(ocr_reader, img_array)
+    
+    try:
+        future = executor.submit(job)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future, started
+
+
+def _wait_for_ocr(job: Tuple[Future, threading.Event], deadline: float) -> List[NormalizedOCRResult]:
+    """
+    Wait for a job from _submit_ocr until a per-request deadline.
+    
+    The engine's own run is limited to OCR_TIMEOUT from when it starts, and
+    queueing plus running never extends past deadline (a time.monotonic()
+    value shared by all of a request's engines, so waiting for them one
+    after another stays within OCR_REQUEST_TIMEOUT). A job abandoned on
+    timeout is cancelled so it does not run later for nobody (a job
+    already running cannot be interrupted and just finishes).
+    
+    Raises:
+        TimeoutError: If the job does not start or finish in time
+    """
+    future, started = job
+    if not started.wait(max(0.0, deadline - time.monotonic())):
+        future.cancel()
+        raise TimeoutError("OCR job did not start before the request deadline")
+    timeout = min(OCR_TIMEOUT, max(0.0, deadline - time.monotonic()))
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        # Before Python 3.11 this is not the builtin TimeoutError
+        future.cancel()
+        raise TimeoutError(f"OCR job did not finish within {timeout:.1f}s") from None
+
+
+def _warm_up_ocr_engines() -> None:
+    """
+    Run each loaded OCR engine once on a blank frame.
+    
+    The first inference pays for lazy backend initialization (MKL/oneDNN
+    kernel selection, memory pools); doing it at startup keeps that cost
+    off the first real request. Failures are logged and ignored.
+    """
+    frame = np.full((OCR_WARMUP_SIZE, OCR_WARMUP_SIZE, 3), 255, dtype=np.uint8)
+    jobs = []
+    if easyocr_reader:
+        jobs.append(_submit_ocr(_easyocr_executor, _easyocr_slots, run_easyocr, easyocr_reader, frame))
+    if paddleocr_reader:
+        jobs.append(_submit_ocr(_paddleocr_executor, _paddleocr_slots, run_paddleocr, paddleocr_reader, frame))
+    deadline = time.monotonic() + OCR_REQUEST_TIMEOUT
+    for job in jobs:
+        try:
+            _wait_for_ocr(job, deadline)
+        except Exception as e:
+            logger.warning("OCR warm-up failed: %s", e)
+    if jobs:
+        logger.info("OCR engines warmed up on a %dx%d frame", OCR_WARMUP_SIZE, OCR_WARMUP_SIZE)
+
+
 # Initialize OCR engines and translators
 easyocr_reader = _load_easyocr()
 paddleocr_reader = _load_paddleocr()
@@ -384,12 +652,13 @@ except Exception as e:
     cc_dictionary = None
 
 # Initialize CC-CEDICT translator for character translation (replaces RuleBasedTranslator)
-# Note: This loads its own CCDictionary instance for translation purposes only
+# Note: The translator only reads the dictionary, so it shares the instance
+# loaded above instead of parsing the file a second time
 cc_translator: Optional[CCDictionaryTranslator] = None
 try:
-    cc_dict_path = Path(__file__).parent / "data" / "cc_cedict.json"
-    translation_dictionary = CCDictionary(str(cc_dict_path))
-    cc_translator = CCDictionaryTranslator(translation_dictionary, default_strategy=DefinitionStrategy.FIRST)
+    if cc_dictionary is None:
+        raise RuntimeError("CC-CEDICT dictionary not loaded")
+    cc_translator = CCDictionaryTranslator(cc_dictionary, default_strategy=DefinitionStrategy.FIRST)
     print(f"✅ CC-CEDICT translator initialized ({len(cc_translator):,} entries, strategy: {cc_translator.default_strategy.value}).")
     logger.info("CCDictionaryTranslator initialized with %d entries (strategy: %s)", 
                len(cc_translator), cc_translator.default_strategy.value)
@@ -427,6 +696,454 @@ else:
     logger.info("Qwen refiner ready (Qwen2.5-1.5B-Instruct)")
 
 
+def _recognize_image(content: Union[bytes, BinaryIO]) -> Tuple[List[Glyph], str, float, float, str, Optional[str]]:
+    """
+    Preprocess an image, run both OCR engines and fuse their output.
+    
+    Args:
+        content: Raw uploaded image bytes, or the upload's file object
+        
+    Returns:
+        Tuple of (glyphs, full_text, ocr_confidence, ocr_coverage,
+        dictionary source, dictionary version)
+        
+    Raises:
+        HTTPException: If preprocessing fails or no text is recognized
+    """
+    # Preprocess image
+    try:
+        img_array, (width, height) = _preprocess_image(content)
+        logger.info("Image preprocessed: %dx%d", width, height)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Image preprocessing error: %s", e)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Failed to process image: {str(e)}"
+        ) from e
+    
+    # Run both OCR engines in parallel on the same preprocessed image
+    easyocr_results = []
+    paddleocr_results = []
+    
+    try:
+        jobs = {}
+        engines = (
+            ('easyocr', easyocr_reader, run_easyocr, _easyocr_executor, _easyocr_slots),
+            ('paddleocr', paddleocr_reader, run_paddleocr, _paddleocr_executor, _paddleocr_slots),
+        )
+        for engine_name, ocr_reader, run, executor, slots in engines:
+            if not ocr_reader:
+                continue
+            job = _submit_ocr(executor, slots, run, ocr_reader, img_array)
+            if job is None:
+                # Backlog full: shed this request rather than grow the queue
+                for future, _ in jobs.values():
+                    future.cancel()
+                raise HTTPException(
+                    status_code=503,
+                    detail=f"OCR service is busy ({engine_name} queue full). Please retry shortly."
+                )
+            jobs[engine_name] = job
+        
+        # Wait for results; both engines share one deadline
+        deadline = time.monotonic() + OCR_REQUEST_TIMEOUT
+        for engine_name, job in jobs.items():
+            try:
+                results = _wait_for_ocr(job, deadline)
+                if engine_name == 'easyocr':
+                    easyocr_results = results
+                else:
+                    paddleocr_results = results
+            except Exception as e:
+                # Anything outside the expected engine errors (or a timeout)
+                # escaped run_easyocr/run_paddleocr as a bug; keep its traceback
+                logger.error("%s processing failed: %s", engine_name, e,
+                             exc_info=not isinstance(e, OCR_ENGINE_ERRORS + (TimeoutError,)))
+        
+        # Check if we got any results
+        if not easyocr_results and not paddleocr_results:
+            raise HTTPException(
+                status_code=422,
+                detail="No text detected in image by any OCR engine. Please try: 1) A higher resolution image, 2) Black text on white background, 3) Clearer characters."
+            )
+        
+        logger.info("OCR results: EasyOCR=%d chars, PaddleOCR=%d chars",
+                    len(easyocr_results), len(paddleocr_results))
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("OCR processing failed: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"OCR processing failed: {str(e)}"
+        ) from e
+    
+    # Align and fuse OCR results
+    try:
+        fused_positions = align_ocr_outputs(easyocr_results, paddleocr_results)
+        
+        if not fused_positions:
+            raise HTTPException(
+                status_code=422,
+                detail="No text could be extracted from the image after fusion."
+            )
+        
+        # Convert to Glyph objects and full text
+        # Use CC-CEDICT for intelligent tie-breaking (when OCR engines have equal confidence)
+        # Testing confirmed: Harmless when not needed, helpful in true tie scenarios
+        fusion_dictionary = cc_dictionary if cc_dictionary is not None else None
+        
+        # Add lookup_character method wrapper if dictionary doesn't have it
+        if fusion_dictionary and not hasattr(fusion_dictionary, "lookup_character"):
+            # Wrap lookup_entry to match expected API
+            fusion_dictionary.lookup_character = lambda char: fusion_dictionary.lookup_entry(char)
+        
+        glyphs, full_text, ocr_confidence, ocr_coverage = fuse_character_candidates(
+            fused_positions, translator=fusion_dictionary
+        )
+        
+        # Capture dictionary metadata for API response
+        if fusion_dictionary == cc_dictionary and cc_dictionary is not None:
+            # Using CC-CEDICT
+            ocr_dict_source = "CC-CEDICT"
+            ocr_dict_metadata = cc_dictionary.get_metadata()
+            ocr_dict_version = ocr_dict_metadata.get("format_version", "1.0")
+        else:
+            # No dictionary (confidence-based)
+            ocr_dict_source = "None (Confidence-Based)"
+            ocr_dict_version = None
+        
+        if not full_text or not full_text.strip():
+            raise HTTPException(
+                status_code=422,
+                detail="No text could be extracted from the image."
+            )
+        
+        logger.info(
+            "Fused %d positions into %d glyphs, text length: %d (confidence: %.2f%%, coverage: %.1f%%) [Dict: %s]",
+            len(fused_positions), len(glyphs), len(full_text),
+            ocr_confidence * 100, ocr_coverage, ocr_dict_source
+        )
+        
+        # Log dictionary performance stats (debug level)
+        if cc_dictionary is not None:
+            cc_dictionary.log_performance_stats(level="debug")
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error fusing OCR results: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to process OCR results: {str(e)}"
+        ) from e
+    
+    return glyphs, full_text, ocr_confidence, ocr_coverage, ocr_dict_source, ocr_dict_version
+
+
+def _glyph_dicts(glyphs: List[Glyph]) -> List[Dict[str, Any]]:
+    """
+    Plain-dict view of OCR glyphs for RuleBasedTranslator.
+    
+    Only the RuleBasedTranslator and error paths need it (CC-CEDICT
+    translation takes the Glyph objects directly), so it is built on demand.
+    Dict displays are ~3.5x faster here than dict(zip(keys, attrgetter(g))).
+    """
+    return [
+        {
+            "symbol": g.symbol,
+            "bbox": g.bbox,
+            "confidence": g.confidence
+        }
+        for g in glyphs
+    ]
+
+
+def _enriched_glyph(original_glyph: Glyph, enriched_data: Dict[str, Any]) -> Glyph:
+    """
+    Merge a translator glyph dict into the OCR glyph it was built from.
+    
+    Validation is skipped only when every field already has its declared
+    type: symbol a str, confidence a float, meaning a str or None, and bbox
+    the original glyph's validated list (or None). Anything else, such as an
+    int confidence or a non-string meaning from a custom dictionary, goes
+    through normal Glyph validation.
+    """
+    symbol = enriched_data.get("symbol", original_glyph.symbol)
+    bbox = enriched_data.get("bbox") or original_glyph.bbox
+    confidence = enriched_data.get("confidence", original_glyph.confidence)
+    meaning = enriched_data.get("meaning")
+    if (
+        type(symbol) is str
+        and type(confidence) is float
+        and (meaning is None or type(meaning) is str)
+        and (bbox is None or bbox is original_glyph.bbox)
+    ):
+        return Glyph.model_construct(
+            symbol=symbol, bbox=bbox, confidence=confidence, meaning=meaning
+        )
+    return Glyph(symbol=symbol, bbox=bbox, confidence=confidence, meaning=meaning)
+
+
+def _image_digest(stream: BinaryIO) -> bytes:
+    """
+    Content address of an uploaded image (used as the OCR cache key).
+    
+    Only collision resistance matters here, so the SIMD xxh3-128 hash is
+    used when xxhash is installed; blake2b is the stdlib fallback. The
+    upload is hashed in chunks and rewound, never held as one bytes object.
+    """
+    hasher = xxhash.xxh3_128() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(_DIGEST_CHUNK_SIZE), b""):
+        hasher.update(chunk)
+    stream.seek(0)
+    return hasher.digest()
+
+
+def _get_cached_ocr(key: bytes) -> Optional[tuple]:
+    """
+    Return the cached OCR output for an image digest, marking it recently used.
+    
+    Falls back to the on-disk cache (OCR_CACHE_DIR) on a memory miss and
+    promotes disk hits into memory.
+    """
+    with _ocr_cache_lock:
+        cached = _ocr_cache.get(key)
+        if cached is not None:
+            _ocr_cache.move_to_end(key)
+            return cached
+    
+    if OCR_CACHE_DIR:
+        cached = _load_disk_cached_ocr(key)
+        if cached is not None:
+            _remember_cached_ocr(key, cached)
+    return cached
+
+
+def _store_cached_ocr(key: bytes, value: tuple) -> None:
+    """Cache OCR output for an image digest in memory and, if enabled, on disk."""
+    if OCR_CACHE_SIZE <= 0:
+        return
+    _remember_cached_ocr(key, value)
+    if OCR_CACHE_DIR:
+        _save_disk_cached_ocr(key, value)
+
+
+def _remember_cached_ocr(key: bytes, value: tuple) -> None:
+    """Insert into the in-memory LRU, evicting the least recently used."""
+    with _ocr_cache_lock:
+        _ocr_cache[key] = value
+        _ocr_cache.move_to_end(key)
+        while len(_ocr_cache) > OCR_CACHE_SIZE:
+            _ocr_cache.popitem(last=False)
+
+
+def _get_cached_response(key: bytes) -> Optional["InferenceResponse"]:
+    """Return the cached response for an image digest, marking it recently used."""
+    with _ocr_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            _response_cache.move_to_end(key)
+        return cached
+
+
+def _store_cached_response(key: bytes, response: "InferenceResponse") -> None:
+    """Cache a complete response for an image digest, evicting the least recently used."""
+    if RESPONSE_CACHE_SIZE <= 0:
+        return
+    with _ocr_cache_lock:
+        _response_cache[key] = response
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+def _lookup_cached_ocr(stream: BinaryIO) -> Tuple[bytes, Optional[tuple]]:
+    """Hash an upload and look it up in the OCR cache (blocking; run off the event loop)."""
+    key = _image_digest(stream)
+    return key, _get_cached_ocr(key)
+
+
+_DISK_CACHE_NAMESPACE_PREFIX = "ocr-"
+_DISK_CACHE_TRIM_INTERVAL = 256  # Saves between size checks of the namespace
+_disk_cache_saves = 0  # Saves by this process (guarded by _ocr_cache_lock)
+
+
+def _package_version(name: str) -> Optional[str]:
+    """Installed version of a distribution, or None if it is not installed."""
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _disk_cache_dir() -> Path:
+    """
+    OCR_CACHE_DIR subdirectory for the running configuration.
+    
+    Cached OCR output depends on which engines loaded and their versions,
+    the preprocessing configuration and the fusion dictionary, so all of
+    them are hashed into the directory name: after an upgrade or config
+    change the service starts a fresh namespace instead of serving stale
+    glyphs and dictionary metadata.
+    """
+    fingerprint = {
+        "format": OCR_CACHE_FORMAT_VERSION,
+        "easyocr": easyocr.__version__ if easyocr_reader is not None else None,
+        "torch": torch.__version__,
+        "paddleocr": _package_version("paddleocr") if paddleocr_reader is not None else None,
+        "paddlepaddle": _package_version("paddlepaddle") if paddleocr_reader is not None else None,
+        "preprocessing": get_preprocessing_config_summary(),
+        "opencv": PREPROCESSING_CV2_AVAILABLE,
+        "dictionary": (
+            [cc_dictionary.get_metadata(), len(cc_dictionary)] if cc_dictionary is not None else None
+        ),
+    }
+    digest = hashlib.blake2b(
+        json.dumps(fingerprint, sort_keys=True, default=str).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return Path(OCR_CACHE_DIR) / f"{_DISK_CACHE_NAMESPACE_PREFIX}{digest}"
+
+
+def _disk_cache_path(key: bytes) -> Path:
+    """Sidecar file holding one cached OCR result."""
+    return _disk_cache_dir() / f"{key.hex()}.json"
+
+
+def _prune_disk_cache() -> None:
+    """
+    Remove stale namespaces from OCR_CACHE_DIR and trim the current one.
+    
+    Runs at startup and every _DISK_CACHE_TRIM_INTERVAL saves. Only
+    namespace directories and pre-namespace "<digest>.pkl" pickles are
+    removed from OCR_CACHE_DIR itself; the current namespace keeps its
+    OCR_DISK_CACHE_MAX_ENTRIES most recently used files (disk hits refresh
+    a file's mtime). Failures only log.
+    """
+    current = _disk_cache_dir()
+    try:
+        for child in current.parent.iterdir():
+            if child == current:
+                continue
+            if child.is_dir() and child.name.startswith(_DISK_CACHE_NAMESPACE_PREFIX):
+                shutil.rmtree(child, ignore_errors=True)
+            elif child.suffix == ".pkl" and len(child.stem) == 32 and child.is_file():
+                child.unlink(missing_ok=True)
+        
+        if not current.is_dir():
+            return
+        entries = []
+        for path in current.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        if len(entries) <= OCR_DISK_CACHE_MAX_ENTRIES:
+            return
+        entries.sort(reverse=True)
+        for _, path in entries[OCR_DISK_CACHE_MAX_ENTRIES:]:
+            path.unlink(missing_ok=True)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Failed to prune OCR cache directory %s: %s", OCR_CACHE_DIR, e)
+
+
+def _encode_cached_ocr(value: tuple) -> bytes:
+    """Serialize a cached OCR tuple (see _recognize_image) to JSON bytes."""
+    glyphs, full_text, ocr_confidence, ocr_coverage, dict_source, dict_version = value
+    return json.dumps({
+        "glyphs": [
+            {"symbol": g.symbol, "bbox": g.bbox, "confidence": g.confidence, "meaning": g.meaning}
+            for g in glyphs
+        ],
+        "text": full_text,
+        "confidence": ocr_confidence,
+        "coverage": ocr_coverage,
+        "dictionary_source": dict_source,
+        "dictionary_version": dict_version,
+    }, ensure_ascii=False).encode("utf-8")
+
+
+def _decode_cached_ocr(raw: bytes) -> tuple:
+    """
+    Rebuild a cached OCR tuple from _encode_cached_ocr output.
+    
+    The file may have been written by anyone with access to OCR_CACHE_DIR,
+    so it is plain JSON (never unpickled) and every field is validated.
+    
+    Raises:
+        ValueError, TypeError, KeyError: If the payload does not have the
+            expected shape (pydantic's ValidationError is a ValueError)
+    """
+    data = json.loads(raw)
+    if not isinstance(data, dict) or not isinstance(data.get("glyphs"), list):
+        raise ValueError("not a cached OCR result")
+    full_text = data["text"]
+    dict_source = data["dictionary_source"]
+    dict_version = data["dictionary_version"]
+    if not isinstance(full_text, str) or not isinstance(dict_source, str):
+        raise ValueError("invalid text or dictionary source")
+    if dict_version is not None and not isinstance(dict_version, str):
+        raise ValueError("invalid dictionary version")
+    return (
+        tuple(Glyph(**glyph) for glyph in data["glyphs"]),
+        full_text,
+        float(data["confidence"]),
+        float(data["coverage"]),
+        dict_source,
+        dict_version,
+    )
+
+
+def _load_disk_cached_ocr(key: bytes) -> Optional[tuple]:
+    """Read a cached OCR result from OCR_CACHE_DIR (None if absent or unreadable)."""
+    path = _disk_cache_path(key)
+    try:
+        with open(path, "rb") as f:
+            value = _decode_cached_ocr(f.read())
+        try:
+            os.utime(path)  # Mark recently used for _prune_disk_cache
+        except OSError:
+            pass
+        return value
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable OCR cache entry %s: %s", key.hex(), e)
+        return None
+
+
+def _save_disk_cached_ocr(key: bytes, value: tuple) -> None:
+    """Write a cached OCR result to OCR_CACHE_DIR atomically; failures only log."""
+    path = _disk_cache_path(key)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_encode_cached_ocr(value))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning("Failed to persist OCR cache entry %s: %s", key.hex(), e)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return
+    
+    global _disk_cache_saves
+    with _ocr_cache_lock:
+        _disk_cache_saves += 1
+        trim_due = _disk_cache_saves % _DISK_CACHE_TRIM_INTERVAL == 0
+    if trim_due:
+        _prune_disk_cache()
+
+
 @app.get("/health")
 def health():
     """Health check endpoint with detailed status information."""
@@ -508,9 +1225,12 @@ async def process_image(file: UploadFile = File(...)):
             detail=f"Unsupported file type: {file.content_type}. Supported formats: image/jpg, image/png, image/jpeg, image/webp"
         )
     
-    # Read and validate file size
-    content = await file.read()
-    file_size = len(content)
+    # Validate file size from the spooled upload itself; the image is decoded
+    # straight from this file object, without copying it into a bytes object
+    upload = file.file
+    upload.seek(0, io.SEEK_END)
+    file_size = upload.tell()
+    upload.seek(0)
     
     if file_size > MAX_IMAGE_SIZE:
         raise HTTPException(
@@ -533,140 +1253,45 @@ async def process_image(file: UploadFile = File(...)):
             detail="OCR service not available. Neither EasyOCR nor PaddleOCR is installed or initialized."
         )
     
-    # Preprocess image
-    try:
-        img_array, pil_image = _preprocess_image(content)
-        logger.info("Image preprocessed: %dx%d", pil_image.size[0], pil_image.size[1])
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Image preprocessing error: %s", e)
-        raise HTTPException(
-            status_code=400,
-            detail=f"Failed to process image: {str(e)}"
-        ) from e
-    
-    # Run both OCR engines in parallel on the same preprocessed image
-    easyocr_results = []
-    paddleocr_results = []
-    
-    try:
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            futures = {}
-            
-            if easyocr_reader:
-                futures['easyocr'] = executor.submit(run_easyocr, easyocr_reader, img_array)
-            if paddleocr_reader:
-                futures['paddleocr'] = executor.submit(run_paddleocr, paddleocr_reader, img_array)
-            
-            # Wait for results
-            for engine_name, future in futures.items():
-                try:
-                    results = future.result(timeout=OCR_TIMEOUT)
-                    if engine_name == 'easyocr':
-                        easyocr_results = results
-                    else:
-                        paddleocr_results = results
-                except Exception as e:
-                    logger.error("%s processing failed: %s", engine_name, e)
-        
-        # Check if we got any results
-        if not easyocr_results and not paddleocr_results:
-            raise HTTPException(
-                status_code=422,
-                detail="No text detected in image by any OCR engine. Please try: 1) A higher resolution image, 2) Black text on white background, 3) Clearer characters."
-            )
-        
-        logger.info("OCR results: EasyOCR=%d chars, PaddleOCR=%d chars",
-                    len(easyocr_results), len(paddleocr_results))
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("OCR processing failed: %s", e)
-        raise HTTPException(
-            status_code=500,
-            detail=f"OCR processing failed: {str(e)}"
-        ) from e
-    
-    # Align and fuse OCR results
-    try:
-        fused_positions = align_ocr_outputs(easyocr_results, paddleocr_results)
-        
-        if not fused_positions:
-            raise HTTPException(
-                status_code=422,
-                detail="No text could be extracted from the image after fusion."
-            )
-        
-        # Convert to Glyph objects and full text
-        # Use CC-CEDICT for intelligent tie-breaking (when OCR engines have equal confidence)
-        # Testing confirmed: Harmless when not needed, helpful in true tie scenarios
-        fusion_dictionary = cc_dictionary if cc_dictionary is not None else None
-        
-        # Add lookup_character method wrapper if dictionary doesn't have it
-        if fusion_dictionary and not hasattr(fusion_dictionary, "lookup_character"):
-            # Wrap lookup_entry to match expected API
-            fusion_dictionary.lookup_character = lambda char: fusion_dictionary.lookup_entry(char)
-        
-        glyphs, full_text, ocr_confidence, ocr_coverage = fuse_character_candidates(
-            fused_positions, translator=fusion_dictionary
+    # Identical uploads reuse the whole previous response, or at least the
+    # fused OCR output, skipping preprocessing and both OCR engines
+    loop = asyncio.get_running_loop()
+    cache_key = None
+    cached_ocr = None
+    if OCR_CACHE_SIZE > 0 or RESPONSE_CACHE_SIZE > 0:
+        cache_key, cached_ocr = await loop.run_in_executor(None, _lookup_cached_ocr, upload)
+        cached_response = _get_cached_response(cache_key)
+        if cached_response is not None:
+            logger.info("Response cache hit for %s", file.filename)
+            return cached_response
+    if cached_ocr is not None:
+        logger.info("OCR cache hit for %s", file.filename)
+        glyphs, full_text, ocr_confidence, ocr_coverage, ocr_dict_source, ocr_dict_version = cached_ocr
+        glyphs = list(glyphs)
+    else:
+        # Preprocessing and OCR are blocking; run them off the event loop so
+        # other requests keep being served meanwhile
+        glyphs, full_text, ocr_confidence, ocr_coverage, ocr_dict_source, ocr_dict_version = (
+            await loop.run_in_executor(None, _recognize_image, upload)
         )
-        
-        # Capture dictionary metadata for API response
-        if fusion_dictionary == cc_dictionary and cc_dictionary is not None:
-            # Using CC-CEDICT
-            ocr_dict_source = "CC-CEDICT"
-            ocr_dict_metadata = cc_dictionary.get_metadata()
-            ocr_dict_version = ocr_dict_metadata.get("format_version", "1.0")
-        else:
-            # No dictionary (confidence-based)
-            ocr_dict_source = "None (Confidence-Based)"
-            ocr_dict_version = None
-        
-        if not full_text or not full_text.strip():
-            raise HTTPException(
-                status_code=422,
-                detail="No text could be extracted from the image."
+        if cache_key is not None:
+            await loop.run_in_executor(
+                None, _store_cached_ocr, cache_key,
+                (tuple(glyphs), full_text, ocr_confidence, ocr_coverage, ocr_dict_source, ocr_dict_version)
             )
-        
-        logger.info(
-            "Fused %d positions into %d glyphs, text length: %d (confidence: %.2f%%, coverage: %.1f%%) [Dict: %s]",
-            len(fused_positions), len(glyphs), len(full_text),
-            ocr_confidence * 100, ocr_coverage, ocr_dict_source
-        )
-        
-        # Log dictionary performance stats (debug level)
-        if cc_dictionary is not None:
-            cc_dictionary.log_performance_stats(level="debug")
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error fusing OCR results: %s", e)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to process OCR results: {str(e)}"
-        ) from e
     
     # Translate text using dictionary
     # Priority: CC-CEDICT Translator (120k entries) → RuleBasedTranslator (276 entries)
     translation_source = "Unknown"
+    # Set when any translation stage fails, so the degraded response is not cached
+    translation_failed = False
     try:
-        glyph_dicts = [
-            {
-                "symbol": g.symbol,
-                "bbox": g.bbox,
-                "confidence": g.confidence
-            }
-            for g in glyphs
-        ]
-        
         # Try CC-CEDICT translator first (if available)
         if cc_translator is not None:
             try:
                 logger.debug("Using CCDictionaryTranslator for translation (120,474 entries)")
-                result = cc_translator.translate_text(full_text, glyphs)
+                # Only the summary dict is used here, so skip per-character details
+                result = cc_translator.translate_text(full_text, glyphs, include_details=False)
                 translation_result = result.to_dict()  # Convert to dict format
                 translation_source = "CC-CEDICT"
                 logger.info("CC-CEDICT translation completed: %.1f%% coverage (%d/%d characters)", 
@@ -675,23 +1300,25 @@ async def process_image(file: UploadFile = File(...)):
                 cc_translator.log_translation_stats(level="debug")
             except Exception as cc_error:
                 logger.warning("CCDictionaryTranslator failed: %s. Falling back to RuleBasedTranslator.", cc_error)
+                translation_failed = True
                 # Fall back to RuleBasedTranslator
-                translation_result = translator.translate_text(full_text, glyph_dicts)
+                translation_result = translator.translate_text(full_text, _glyph_dicts(glyphs))
                 translation_source = "RuleBasedTranslator"
                 logger.info("RuleBasedTranslator (fallback) completed: %.1f%% coverage", 
                            translation_result.get('coverage', 0))
         else:
             # CC-CEDICT not available, use RuleBasedTranslator
             logger.debug("Using RuleBasedTranslator for translation (276 entries)")
-            translation_result = translator.translate_text(full_text, glyph_dicts)
+            translation_result = translator.translate_text(full_text, _glyph_dicts(glyphs))
             translation_source = "RuleBasedTranslator"
             logger.info("RuleBasedTranslator translation completed: %.1f%% coverage", 
                        translation_result.get('coverage', 0))
         
     except Exception as e:
         logger.error("Translation failed: %s", e)
+        translation_failed = True
         translation_result = {
-            "glyphs": glyph_dicts,
+            "glyphs": _glyph_dicts(glyphs),
             "translation": "",
             "unmapped": [],
             "coverage": 0.0,
@@ -699,23 +1326,14 @@ async def process_image(file: UploadFile = File(...)):
         }
         translation_source = "Error"
     
-    # Enrich glyphs with meanings from translation
-    enriched_glyphs = []
+    # Enrich glyphs with meanings from translation; glyphs beyond the
+    # translated ones are kept unchanged
     translation_glyphs = translation_result.get("glyphs", [])
-    
-    for i, original_glyph in enumerate(glyphs):
-        if i < len(translation_glyphs):
-            enriched_data = translation_glyphs[i]
-            enriched_glyphs.append(
-                Glyph(
-                    symbol=enriched_data.get("symbol", original_glyph.symbol),
-                    bbox=enriched_data.get("bbox") or original_glyph.bbox,
-                    confidence=enriched_data.get("confidence", original_glyph.confidence),
-                    meaning=enriched_data.get("meaning")
-                )
-            )
-        else:
-            enriched_glyphs.append(original_glyph)
+    enriched_glyphs = [
+        _enriched_glyph(original_glyph, enriched_data)
+        for original_glyph, enriched_data in zip(glyphs, translation_glyphs)
+    ]
+    enriched_glyphs.extend(glyphs[len(enriched_glyphs):])
     
     # Use OCR metrics from fusion step (computed during fuse_character_candidates)
     # ocr_confidence: Average confidence of OCR detections (0.0-1.0)
@@ -731,22 +1349,8 @@ async def process_image(file: UploadFile = File(...)):
     logger.info("Extracted OCR text length: %d characters", len(full_text))
     
     # Phase 5: Perform sentence-level neural translation (MarianMT) via adapter
-    # Build canonical input string from glyphs preserving token boundaries
-    # Verify glyph order matches full_text order
-    canonical_text_from_glyphs = "".join(g.symbol for g in glyphs)
-    if canonical_text_from_glyphs != full_text:
-        logger.warning(
-            "Glyph order mismatch: glyph text (%d chars) != full_text (%d chars). "
-            "Using full_text for canonical input.",
-            len(canonical_text_from_glyphs), len(full_text)
-        )
-        logger.debug("Glyph text: %s", canonical_text_from_glyphs[:100])
-        logger.debug("Full text: %s", full_text[:100])
-    else:
-        logger.debug(
-            "Glyph order verified: %d glyphs match %d characters in full_text",
-            len(glyphs), len(full_text)
-        )
+    # full_text is the canonical input: fuse_character_candidates builds it
+    # from the glyph symbols in order, so it always matches the glyph order
     
     sentence_translation = None
     adapter_output = None
@@ -761,12 +1365,16 @@ async def process_image(file: UploadFile = File(...)):
             )
             
             # Build structured input preserving token boundaries
-            adapter_output = marian_adapter.translate(
-                glyphs=glyphs,
-                confidence=ocr_confidence,
-                dictionary_coverage=ocr_coverage,
-                locked_tokens=None,  # Step 4 (Phase 5): Auto-populated by adapter using semantic contract
-                raw_text=full_text  # Use full_text to ensure consistency
+            adapter_output = await loop.run_in_executor(
+                _translation_executor,
+                functools.partial(
+                    marian_adapter.translate,
+                    glyphs=glyphs,
+                    confidence=ocr_confidence,
+                    dictionary_coverage=ocr_coverage,
+                    locked_tokens=None,  # Step 4 (Phase 5): Auto-populated by adapter using semantic contract
+                    raw_text=full_text  # Use full_text to ensure consistency
+                )
             )
             
             sentence_translation = adapter_output.translation if adapter_output else None
@@ -793,12 +1401,15 @@ async def process_image(file: UploadFile = File(...)):
             logger.error("Phase 5: MarianAdapter translation failed: %s", e, exc_info=True)
             sentence_translation = None
             adapter_output = None
+            translation_failed = True
             
             # Fallback to direct sentence_translator if adapter fails
             logger.info("Falling back to direct sentence_translator...")
             if sentence_translator and sentence_translator.is_available():
                 try:
-                    sentence_translation = sentence_translator.translate(full_text)
+                    sentence_translation = await loop.run_in_executor(
+                        _translation_executor, sentence_translator.translate, full_text
+                    )
                     logger.info("Fallback translation completed")
                 except Exception as fallback_error:
                     logger.error("Fallback translation also failed: %s", fallback_error)
@@ -808,11 +1419,14 @@ async def process_image(file: UploadFile = File(...)):
         logger.debug("MarianAdapter not available, using direct sentence_translator (fallback)")
         try:
             logger.info("Calling MarianMT translator with text: %s", full_text[:100] if full_text else "Empty")
-            sentence_translation = sentence_translator.translate(full_text)
+            sentence_translation = await loop.run_in_executor(
+                _translation_executor, sentence_translator.translate, full_text
+            )
             logger.info("Sentence translation completed: %s", sentence_translation[:200] if sentence_translation else "None")
         except Exception as e:
             logger.error("Sentence translation failed: %s", e)
             sentence_translation = None
+            translation_failed = True
     else:
         logger.debug("MarianAdapter and sentence_translator not available, skipping neural translation")
     
@@ -823,9 +1437,13 @@ async def process_image(file: UploadFile = File(...)):
     if sentence_translation and qwen_refiner and qwen_refiner.is_available():
         try:
             logger.info("Starting Qwen refinement of MarianMT translation...")
-            refined_translation = qwen_refiner.refine_translation_with_qwen(
-                nmt_translation=sentence_translation,
-                ocr_text=full_text
+            refined_translation = await loop.run_in_executor(
+                _translation_executor,
+                functools.partial(
+                    qwen_refiner.refine_translation_with_qwen,
+                    nmt_translation=sentence_translation,
+                    ocr_text=full_text
+                )
             )
             if refined_translation:
                 logger.info("Qwen refinement completed: %s", refined_translation[:50])
@@ -861,7 +1479,7 @@ async def process_image(file: UploadFile = File(...)):
         }
         logger.debug("Step 7: Semantic metadata prepared for API response: %s", semantic_metadata)
     
-    return InferenceResponse(
+    response = InferenceResponse(
         text=full_text,
         translation=translation_result.get("translation", ""),  # Dictionary-based
         sentence_translation=sentence_translation,  # Neural sentence translation (MarianMT)
@@ -876,3 +1494,11 @@ async def process_image(file: UploadFile = File(...)):
         translation_source=translation_source,  # Translation dictionary source (CC-CEDICT, RuleBasedTranslator, or Error)
         semantic=semantic_metadata,  # Phase 5 Step 7: Semantic refinement metadata (optional)
     )
+    
+    # Only complete results are cached, so transient translation failures
+    # (CC-CEDICT fallback, MarianMT/adapter errors, Qwen failures) are
+    # retried on the next upload
+    if cache_key is not None and not translation_failed and qwen_status != "failed":
+        _store_cached_response(cache_key, response)
+    
+    return response
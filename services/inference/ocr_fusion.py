@@ -383,7 +383,7 @@ def fuse_character_candidates(
     Returns:
         Tuple of:
         - List of Glyph objects
-        - Full text string
+        - Full text string (the glyph symbols joined in order)
         - Average confidence (0.0-1.0)
         - Translation coverage (0.0-100.0 percentage)
         
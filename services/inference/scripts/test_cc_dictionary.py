@@ -64,9 +64,6 @@ def test_dictionary(dict_path):
         stats = dictionary.get_stats()
         print(f"\nDictionary statistics:")
         print(f"  - Entries: {stats['entry_count']:,}")
-        print(f"  - Cache hits: {stats['cache_hits']}")
-        print(f"  - Cache misses: {stats['cache_misses']}")
-        print(f"  - Cache size: {stats['cache_size']}/{stats['cache_maxsize']}")
         
         # Test operators
         print(f"\nOperator tests:")
@@ -18,7 +18,7 @@ from unittest.mock import Mock, patch
 # Import the CCDictionary class
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from cc_dictionary import CCDictionary, reset_dictionary
+from cc_dictionary import CCDictionary, get_dictionary, reset_dictionary
 
 
 # ============================================================================
@@ -145,6 +145,104 @@ def test_initialization_empty_dictionary(tmp_path):
         CCDictionary(str(empty_file))
 
 
+# ============================================================================
+# COMPACT STORAGE TESTS
+# ============================================================================
+
+def test_compact_lookup_matches_eager(sample_dict_file, sample_dictionary_data):
+    """Test compact storage (or its plain-dict fallback) returns the same entries."""
+    dictionary = CCDictionary(sample_dict_file, compact=True)
+    assert len(dictionary) == 5
+    for key, entry in sample_dictionary_data.items():
+        if key != '_metadata':
+            assert dictionary.lookup(key)._asdict() == entry
+    assert dictionary.lookup_character("学") == "to learn"
+    assert dictionary.get_simplified("學") == "学"
+
+
+def test_compact_trie_matches_plain_dict(tmp_path):
+    """Test marisa-trie storage gives the same lookups, prefixes and segments."""
+    pytest.importorskip("marisa_trie")
+    
+    words = {
+        "中": ("中", "zhong1", ["middle"]),
+        "中国": ("中國", "zhong1 guo2", ["China"]),
+        "中国人": ("中國人", "zhong1 guo2 ren2", ["Chinese person"]),
+        "国": ("國", "guo2", ["country", "nation"]),
+        "人": ("人", "ren2", ["person"]),
+        "学": ("學", "xue2", ["to learn"]),
+        "学生": ("學生", "xue2 sheng1", ["student"]),
+    }
+    data = {
+        key: {
+            "simplified": key,
+            "traditional": traditional,
+            "pinyin": pinyin,
+            "definitions": definitions,
+        }
+        for key, (traditional, pinyin, definitions) in words.items()
+    }
+    data["_metadata"] = {"source": "CC-CEDICT", "version": "test"}
+    dict_file = tmp_path / "words.json"
+    dict_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    
+    plain = CCDictionary(str(dict_file))
+    compact = CCDictionary(str(dict_file), compact=True)
+    assert not isinstance(compact.data, dict)
+    
+    for key in list(words) + ["不存在", ""]:
+        assert compact.lookup(key) == plain.lookup(key)
+        assert compact.lookup_character(key) == plain.lookup_character(key)
+    assert compact.get_simplified("中國") == plain.get_simplified("中國") == "中国"
+    
+    for prefix in ["中", "中国", "学", "不", ""]:
+        assert sorted(compact.keys_with_prefix(prefix)) == sorted(plain.keys_with_prefix(prefix))
+    
+    for text in ["中国人学生", "我是中国人", "学中国"]:
+        assert compact.segment(text) == plain.segment(text)
+
+
+def test_keys_with_prefix(dictionary):
+    """Test prefix enumeration over dictionary keys."""
+    assert dictionary.keys_with_prefix("学") == ["学"]
+    assert dictionary.keys_with_prefix("不存在") == []
+    assert sorted(dictionary.keys_with_prefix("")) == sorted(["学", "你", "好", "中", "國"])
+
+
+# ============================================================================
+# SEGMENTATION TESTS
+# ============================================================================
+
+def test_segment_longest_match(tmp_path, sample_dictionary_data):
+    """Test segment prefers the longest dictionary word at each position."""
+    data = dict(sample_dictionary_data)
+    data["中国"] = {
+        "simplified": "中国",
+        "traditional": "中國",
+        "pinyin": "zhong1 guo2",
+        "definitions": ["China"]
+    }
+    dict_file = tmp_path / "segment_dict.json"
+    dict_file.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+    dictionary = CCDictionary(str(dict_file))
+    
+    segments = dictionary.segment("你好中国学")
+    assert [word for word, _ in segments] == ["你", "好", "中国", "学"]
+    assert segments[2][1]["definitions"] == ["China"]
+
+
+def test_segment_unknown_characters(dictionary):
+    """Test segment emits unknown characters individually with None."""
+    segments = dictionary.segment("学x")
+    assert segments[0][0] == "学"
+    assert segments[1] == ("x", None)
+
+
+def test_segment_empty(dictionary):
+    """Test segment on empty input."""
+    assert dictionary.segment("") == []
+
+
 # ============================================================================
 # LOOKUP METHOD TESTS
 # ============================================================================
@@ -184,22 +282,58 @@ def test_lookup_metadata_key(dictionary):
     assert entry is None
 
 
-def test_lookup_caching(dictionary):
-    """Test that lookup results are cached."""
-    # First lookup
+def test_lookup_returns_same_entry(dictionary):
+    """Test that repeated lookups return the same entry object."""
     entry1 = dictionary.lookup("学")
+    entry2 = dictionary.lookup("学")
+    assert entry1 is entry2
+
+
+def test_lookup_entry_mapping_protocol(dictionary):
+    """Test entries behave as read-only mappings over their field names."""
+    from collections.abc import Mapping
     
-    # Get cache info
-    cache_info = dictionary._cached_lookup.cache_info()
-    hits_before = cache_info.hits
-    misses_before = cache_info.misses
+    entry = dictionary.lookup("学")
+    fields = ['simplified', 'traditional', 'pinyin', 'definitions']
     
-    # Second lookup (should hit cache)
-    entry2 = dictionary.lookup("学")
+    assert isinstance(entry, Mapping)
+    assert list(entry) == fields
+    assert list(entry.keys()) == fields
+    assert len(entry) == 4
+    assert "pinyin" in entry
+    assert "xue2" not in entry
+    assert entry.get("pinyin") == "xue2"
+    assert entry.get("missing", "default") == "default"
+    assert list(entry.values())[2] == "xue2"
+    assert dict(entry.items())['traditional'] == "學"
+    assert dict(entry) == entry._asdict()
+    assert entry == dict(entry)
+    with pytest.raises(KeyError):
+        entry['missing']
+
+
+def test_lookup_entry_serializes_as_object(dictionary):
+    """Test _asdict() gives a JSON object, not a list."""
+    entry = dictionary.lookup("学")
+    payload = json.loads(json.dumps(entry._asdict(), ensure_ascii=False))
     
-    cache_info_after = dictionary._cached_lookup.cache_info()
-    assert cache_info_after.hits > hits_before
-    assert entry1 == entry2
+    assert payload == {
+        'simplified': "学",
+        'traditional': "學",
+        'pinyin': "xue2",
+        'definitions': entry.definitions,
+    }
+
+
+def test_lookup_entry_is_read_only(dictionary):
+    """Test shared entries cannot be modified in place."""
+    entry = dictionary.lookup("学")
+    
+    with pytest.raises(TypeError):
+        entry['pinyin'] = "changed"
+    with pytest.raises(AttributeError):
+        entry.pinyin = "changed"
+    assert dictionary.lookup("学").pinyin == "xue2"
 
 
 # ============================================================================
@@ -423,19 +557,17 @@ def test_get_stats(dictionary):
     assert 'metadata' in stats
     
     assert stats['entry_count'] == 5
-    assert stats['cache_maxsize'] == 2000  # Updated cache size for better performance
+    assert stats['metadata']['source'] == "CC-CEDICT"
 
 
 def test_get_stats_after_lookups(dictionary):
-    """Test get_stats cache info after some lookups."""
-    # Do some lookups
+    """Test get_stats is unaffected by lookups."""
+    dictionary.lookup("学")
     dictionary.lookup("学")
-    dictionary.lookup("学")  # Cache hit
     dictionary.lookup("你")
     
     stats = dictionary.get_stats()
-    assert stats['cache_hits'] >= 1  # At least one cache hit
-    assert stats['cache_misses'] >= 2  # At least two cache misses
+    assert stats['entry_count'] == 5
 
 
 # ============================================================================
@@ -443,30 +575,26 @@ def test_get_stats_after_lookups(dictionary):
 # ============================================================================
 
 def test_clear_cache(dictionary):
-    """Test clear_cache clears the LRU cache."""
-    # Do some lookups to populate cache
+    """Test clear_cache is a safe no-op that leaves lookups working."""
     dictionary.lookup("学")
     dictionary.lookup("你")
     
-    # Get cache size before clear
-    stats_before = dictionary.get_stats()
-    cache_size_before = stats_before['cache_size']
-    
-    # Clear cache
     dictionary.clear_cache()
     
-    # Check cache is cleared
     stats_after = dictionary.get_stats()
     assert stats_after['cache_size'] == 0
     assert stats_after['cache_hits'] == 0
     assert stats_after['cache_misses'] == 0
+    assert dictionary.lookup("学") is not None
+
 
+# ============================================================================
+# LOGGING TESTS
+# ============================================================================
 
 def test_log_performance_stats(dictionary):
     """Test log_performance_stats logs statistics."""
-    # Do some lookups to generate stats
     dictionary.lookup("学")
-    dictionary.lookup("学")  # Cache hit
     dictionary.lookup("你")
     
     # Should not raise any exceptions
@@ -495,6 +623,21 @@ def test_repr(dictionary):
     assert "CC-CEDICT" in repr_str
 
 
+# ============================================================================
+# SINGLETON TESTS
+# ============================================================================
+
+def test_get_dictionary_concurrent_first_call(sample_dict_file):
+    """Test concurrent first calls share a single loaded instance."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        instances = list(executor.map(lambda _: get_dictionary(sample_dict_file), range(16)))
+    
+    assert all(instance is instances[0] for instance in instances)
+    assert len(instances[0]) == 5
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
@@ -523,23 +666,13 @@ def test_full_workflow(dictionary):
 
 
 def test_multiple_lookups_performance(dictionary):
-    """Test performance of multiple lookups."""
-    # First pass (cache misses)
-    for char in ["学", "你", "好", "中"]:
-        dictionary.lookup(char)
-    
-    stats_after_first = dictionary.get_stats()
-    misses_first = stats_after_first['cache_misses']
-    
-    # Second pass (cache hits)
-    for char in ["学", "你", "好", "中"]:
-        dictionary.lookup(char)
-    
-    stats_after_second = dictionary.get_stats()
-    hits_second = stats_after_second['cache_hits']
+    """Test repeated lookups stay consistent."""
+    chars = ["学", "你", "好", "中"]
+    first = [dictionary.lookup(char) for char in chars]
+    second = [dictionary.lookup(char) for char in chars]
     
-    # Should have more hits than misses after second pass
-    assert hits_second >= 4
+    assert first == second
+    assert all(entry is not None for entry in first)
 
 
 # ============================================================================
@@ -27,7 +27,10 @@ from cc_translation import (
     TranslationCandidate,
     CharacterTranslation,
     TranslationResult,
-    create_translator
+    create_translator,
+    CHARACTER_CACHE_SIZE,
+    _TranslationTable,
+    _WHITESPACE
 )
 
 
@@ -101,6 +104,15 @@ def test_create_translator_factory(cc_dict):
     assert translator2.default_strategy == DefinitionStrategy.SHORTEST
 
 
+def test_create_translator_factory_accepts_enum(cc_dict):
+    """Test factory function accepts DefinitionStrategy members as well as names."""
+    translator = create_translator(cc_dict, strategy=DefinitionStrategy.SHORTEST)
+    assert translator.default_strategy == DefinitionStrategy.SHORTEST
+    
+    fallback = create_translator(cc_dict, strategy="unknown")
+    assert fallback.default_strategy == DefinitionStrategy.FIRST
+
+
 # ============================================================================
 # Test Category 2: Character Translation Tests (15 tests)
 # ============================================================================
@@ -164,6 +176,39 @@ def test_translate_whitespace(translator):
     assert result.found_in_dictionary is False
 
 
+def test_translate_ascii_passthrough(translator):
+    """Test ASCII characters without an entry are passed through unmapped."""
+    result = translator.translate_character("x")
+    assert result.primary_definition == "x"
+    assert result.found_in_dictionary is False
+    
+    result.primary_definition = "changed"
+    assert translator.translate_character("x").primary_definition == "x"
+    
+    text_result = translator.translate_text("x好", include_details=False)
+    assert text_result.unmapped == ["x"]
+    assert translator.translate_text_fast("x好") == text_result.translation
+
+
+def test_translate_ascii_headword_uses_dictionary(cc_dict, translator):
+    """Test ASCII headwords present in CC-CEDICT are still looked up."""
+    assert "A" in cc_dict.data
+    result = translator.translate_character("A")
+    assert result.found_in_dictionary is True
+    assert result.primary_definition == cc_dict.lookup("A").definitions[0]
+    
+    for include_details in (True, False):
+        text_result = translator.translate_text("A好", include_details=include_details)
+        assert text_result.unmapped == []
+        assert text_result.translation == translator.translate_text_fast("A好")
+
+
+def test_whitespace_set_matches_isspace():
+    """Test the whitespace set covers exactly the str.isspace() characters."""
+    expected = {chr(cp) for cp in range(sys.maxunicode + 1) if chr(cp).isspace()}
+    assert _WHITESPACE == expected
+
+
 def test_translate_multiple_chars_in_one_call(translator):
     """Test that multi-character input is handled (should warn)."""
     result = translator.translate_character("你好")
@@ -206,6 +251,65 @@ def test_translate_character_statistics_update(translator):
     assert updated_stats["mapped_characters"] > initial_stats["mapped_characters"]
 
 
+def test_translate_character_memoized(translator):
+    """Test repeated characters are served from the translation cache."""
+    translator.clear_cache()
+    translator.reset_stats()
+    
+    first = translator.translate_character("好")
+    second = translator.translate_character("好")
+    
+    assert second == first
+    stats = translator.get_stats()
+    assert stats["cache_misses"] == 1
+    assert stats["cache_hits"] == 1
+    assert stats["mapped_characters"] == 2
+
+
+def test_translate_character_memoized_result_is_not_shared(translator):
+    """Test mutating a returned result does not affect the next lookup."""
+    translator.clear_cache()
+    
+    first = translator.translate_character("好")
+    expected_primary = first.primary_definition
+    expected_definitions = list(first.all_definitions)
+    first.primary_definition = "changed"
+    first.all_definitions.append("changed")
+    first.candidates[0].selected = not first.candidates[0].selected
+    
+    second = translator.translate_character("好")
+    assert second.primary_definition == expected_primary
+    assert second.all_definitions == expected_definitions
+    assert [c.selected for c in second.candidates] == [
+        d == expected_primary for d in expected_definitions
+    ]
+    assert translator.cc_dictionary.lookup("好").definitions == expected_definitions
+
+
+def test_translate_character_candidates_on_demand(translator):
+    """Test candidates skipped by text translation are built when requested."""
+    translator.clear_cache()
+    
+    translator.translate_text("好", include_details=True)
+    result = translator.translate_character("好")
+    
+    assert len(result.candidates) == len(result.all_definitions)
+    assert sum(c.selected for c in result.candidates) >= 1
+
+
+def test_translate_character_candidates_do_not_mutate_shared_result(translator):
+    """Test building candidates later leaves earlier returned results unchanged."""
+    translator.clear_cache()
+    
+    without = translator.translate_character("好", include_candidates=False)
+    with_candidates = translator.translate_character("好")
+    
+    assert without.candidates == []
+    assert with_candidates is not without
+    assert len(with_candidates.candidates) == len(with_candidates.all_definitions)
+    assert translator.translate_character("好") == with_candidates
+
+
 def test_translate_numeric_character(translator):
     """Test translation of numeric characters."""
     result = translator.translate_character("一")  # Chinese number "one"
@@ -228,6 +332,14 @@ def test_translate_character_none_dictionary():
     assert result.primary_definition == "好"  # Fallback
 
 
+def test_translate_ascii_none_dictionary_not_counted():
+    """Test ASCII passthrough leaves stats untouched without a dictionary."""
+    translator_none = CCDictionaryTranslator(None)
+    result = translator_none.translate_character("x")
+    assert result.primary_definition == "x"
+    assert translator_none.get_stats()["unmapped_characters"] == 0
+
+
 # ============================================================================
 # Test Category 3: Text Translation Tests (15 tests)
 # ============================================================================
@@ -272,6 +384,37 @@ def test_translate_text_with_spaces(translator):
     assert " " in result.translation  # Spaces preserved in translation
 
 
+def test_translate_text_without_details_matches(translator):
+    """Test the summary-only path matches the detailed translation."""
+    text = "你好 世界🤔"
+    for strategy in DefinitionStrategy:
+        detailed = translator.translate_text(text, strategy=strategy)
+        summary = translator.translate_text(text, strategy=strategy, include_details=False)
+        
+        assert summary.translation == detailed.translation
+        assert sorted(summary.unmapped) == sorted(detailed.unmapped)
+        assert summary.coverage == detailed.coverage
+        assert summary.character_translations == []
+
+
+def test_translate_text_fast_matches_translation(translator):
+    """Test translate_text_fast() returns the same string as translate_text()."""
+    for text in ["你好世界", "你 好", "你好🤔", " 学习 ", "a"]:
+        assert translator.translate_text_fast(text) == translator.translate_text(text).translation
+    assert translator.translate_text_fast("") == ""
+
+
+def test_translation_table_growth_is_bounded():
+    """Test unseen codepoints are cached only up to CHARACTER_CACHE_SIZE."""
+    table = _TranslationTable([(ord("好"), "good ")])
+    text = "".join(chr(0xE000 + i) for i in range(CHARACTER_CACHE_SIZE + 100))
+    
+    translated = text.translate(table)
+    
+    assert translated == "".join(c + " " for c in text)
+    assert len(table) == 1 + CHARACTER_CACHE_SIZE
+
+
 def test_translate_text_character_translations(translator):
     """Test that character_translations list is populated."""
     result = translator.translate_text("你好")
@@ -313,6 +456,19 @@ def test_translate_text_to_dict_conversion(translator):
     assert dict_result["metadata"]["translation_source"] == "CC-CEDICT"
 
 
+def test_translate_text_to_dict_metadata_is_independent(translator):
+    """Test to_dict() callers cannot modify each other's metadata."""
+    result = translator.translate_text("你好")
+    first = result.to_dict()["metadata"]
+    first["translation_source"] = "changed"
+    second = result.to_dict()["metadata"]
+    
+    assert second is not first
+    assert second["translation_source"] == "CC-CEDICT"
+    assert first["dictionary_entries"] == len(translator)
+    assert first["total_characters"] == 2
+
+
 def test_translate_text_statistics_update(translator):
     """Test that translation statistics are updated."""
     translator.reset_stats()
@@ -387,6 +543,13 @@ def test_strategy_single_definition(translator):
     assert result == "only"
 
 
+def test_strategy_shortest_tie_keeps_first(translator):
+    """Test SHORTEST keeps the earliest of equally short definitions."""
+    definitions = ["long definition", "abc", "xyz", "a longer one"]
+    result = translator.select_primary_definition(definitions, DefinitionStrategy.SHORTEST)
+    assert result == "abc"
+
+
 def test_strategy_empty_definitions(translator):
     """Test strategy with empty definitions list."""
     result = translator.select_primary_definition([], DefinitionStrategy.FIRST)
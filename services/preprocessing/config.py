@@ -106,6 +106,12 @@ BRIGHTNESS_THRESHOLD = _get_int_env(
 )
 """Threshold for adaptive padding color (0-255, >threshold = white, <=threshold = black)"""
 
+BRIGHTNESS_SAMPLE_SIZE = max(1, _get_int_env(
+    "PREPROCESSING_BRIGHTNESS_SAMPLE_SIZE",
+    64
+))
+"""Max grid size (per side) of pixels sampled to pick the padding color (at least 1)"""
+
 
 # ============================================================================
 # SUPPORTED FORMATS
@@ -207,7 +213,8 @@ def get_config_summary() -> dict:
             "contrast_factor": CONTRAST_FACTOR,
             "sharpness_factor": SHARPNESS_FACTOR,
             "padding_size": PADDING_SIZE,
-            "brightness_threshold": BRIGHTNESS_THRESHOLD
+            "brightness_threshold": BRIGHTNESS_THRESHOLD,
+            "brightness_sample_size": BRIGHTNESS_SAMPLE_SIZE
         },
         "optional_enhancements": {
             "noise_reduction": DEFAULT_NOISE_REDUCTION,
@@ -216,7 +223,7 @@ def get_config_summary() -> dict:
             "brightness_norm": DEFAULT_BRIGHTNESS_NORM
         },
         "formats": {
-            "supported": list(SUPPORTED_FORMATS)
+            "supported": sorted(SUPPORTED_FORMATS)
         },
         "opencv_params": {
             "bilateral_filter": {
@@ -14,6 +14,7 @@ Test Coverage:
 - Array conversion & validation
 """
 
+import importlib
 import io
 import logging
 import pytest
@@ -22,20 +23,27 @@ from PIL import Image
 from fastapi import HTTPException
 
 # Import preprocessing functions and configuration
+from .. import image_preprocessing
 from ..image_preprocessing import (
     preprocess_image,
     _validate_format,
     _validate_dimensions,
     _resize_large_image,
     _upscale_small_image,
-    _add_adaptive_padding
+    _enhance_contrast,
+    _enhance_sharpness,
+    _enhance_contrast_sharpness_array,
+    _upscale_small_array,
+    _add_adaptive_padding_array,
+    CV2_AVAILABLE
 )
 from ..config import (
     MIN_IMAGE_DIMENSION,
     MAX_IMAGE_DIMENSION,
     MIN_UPSCALE_DIM,
     PADDING_SIZE,
-    BRIGHTNESS_THRESHOLD
+    BRIGHTNESS_THRESHOLD,
+    BRIGHTNESS_SAMPLE_SIZE
 )
 
 # Configure logging for test debugging
@@ -74,6 +82,14 @@ def image_to_bytes():
     return _convert
 
 
+@pytest.fixture
+def gradient_image():
+    """RGB image with a horizontal gradient and a dark block (non-uniform)."""
+    arr = np.tile(np.linspace(0, 255, 120, dtype=np.uint8), (80, 1))
+    arr[20:60, 30:70] = 40
+    return Image.fromarray(np.stack([arr, arr, arr], axis=2))
+
+
 # ============================================================================
 # FORMAT VALIDATION TESTS
 # ============================================================================
@@ -246,6 +262,27 @@ def test_resize_large_image_both_exceed_max(create_test_image):
     assert resized.size[0] == MAX_IMAGE_DIMENSION or resized.size[1] == MAX_IMAGE_DIMENSION
 
 
+def test_resize_large_jpeg_uses_draft_decode(create_test_image, image_to_bytes):
+    """Verify large JPEGs decoded via draft mode still resize to the exact target."""
+    original_width = MAX_IMAGE_DIMENSION * 2 + 100
+    original_height = MAX_IMAGE_DIMENSION // 2
+    jpeg_bytes = image_to_bytes(
+        create_test_image(width=original_width, height=original_height, color=(200, 120, 40)),
+        format="JPEG"
+    )
+    img = Image.open(io.BytesIO(jpeg_bytes))
+    
+    resized = _resize_large_image(img, MAX_IMAGE_DIMENSION)
+    
+    scale = MAX_IMAGE_DIMENSION / original_width
+    assert resized.size == (MAX_IMAGE_DIMENSION, int(original_height * scale))
+    assert resized.mode == "RGB"
+    
+    # Flat color survives the DCT-scaled decode (within JPEG tolerance)
+    center = resized.getpixel((resized.size[0] // 2, resized.size[1] // 2))
+    assert all(abs(a - b) <= 8 for a, b in zip(center, (200, 120, 40)))
+
+
 # ============================================================================
 # SMALL IMAGE UPSCALING TESTS
 # ============================================================================
@@ -321,15 +358,15 @@ def test_adaptive_padding_bright_image_gets_white_padding(create_test_image):
     """
     # Create bright image (white)
     img = create_test_image(width=100, height=100, color=(255, 255, 255))
-    padded = _add_adaptive_padding(img, PADDING_SIZE)
+    padded = _add_adaptive_padding_array(np.array(img), PADDING_SIZE)
     
     # Size should increase by 2*PADDING_SIZE on each dimension
     expected_width = 100 + 2 * PADDING_SIZE
     expected_height = 100 + 2 * PADDING_SIZE
-    assert padded.size == (expected_width, expected_height)
+    assert padded.shape == (expected_height, expected_width, 3)
     
     # Check corner pixel should be white (255, 255, 255)
-    corner_pixel = padded.getpixel((0, 0))
+    corner_pixel = tuple(padded[0, 0])
     assert corner_pixel == (255, 255, 255), f"Expected white padding, got {corner_pixel}"
     
     logger.debug(f"Bright image correctly received white padding")
@@ -341,15 +378,15 @@ def test_adaptive_padding_dark_image_gets_black_padding(create_test_image):
     """
     # Create dark image (black)
     img = create_test_image(width=100, height=100, color=(0, 0, 0))
-    padded = _add_adaptive_padding(img, PADDING_SIZE)
+    padded = _add_adaptive_padding_array(np.array(img), PADDING_SIZE)
     
     # Size should increase by 2*PADDING_SIZE on each dimension
     expected_width = 100 + 2 * PADDING_SIZE
     expected_height = 100 + 2 * PADDING_SIZE
-    assert padded.size == (expected_width, expected_height)
+    assert padded.shape == (expected_height, expected_width, 3)
     
     # Check corner pixel should be black (0, 0, 0)
-    corner_pixel = padded.getpixel((0, 0))
+    corner_pixel = tuple(padded[0, 0])
     assert corner_pixel == (0, 0, 0), f"Expected black padding, got {corner_pixel}"
     
     logger.debug(f"Dark image correctly received black padding")
@@ -366,16 +403,16 @@ def test_adaptive_padding_threshold_boundary(create_test_image):
                                          color=(BRIGHTNESS_THRESHOLD, 
                                                BRIGHTNESS_THRESHOLD, 
                                                BRIGHTNESS_THRESHOLD))
-    padded_at = _add_adaptive_padding(img_at_threshold, PADDING_SIZE)
-    corner_at = padded_at.getpixel((0, 0))
+    padded_at = _add_adaptive_padding_array(np.array(img_at_threshold), PADDING_SIZE)
+    corner_at = tuple(padded_at[0, 0])
     
     # Test just above threshold (should get white)
     img_above = create_test_image(width=100, height=100,
                                   color=(BRIGHTNESS_THRESHOLD + 1,
                                         BRIGHTNESS_THRESHOLD + 1,
                                         BRIGHTNESS_THRESHOLD + 1))
-    padded_above = _add_adaptive_padding(img_above, PADDING_SIZE)
-    corner_above = padded_above.getpixel((0, 0))
+    padded_above = _add_adaptive_padding_array(np.array(img_above), PADDING_SIZE)
+    corner_above = tuple(padded_above[0, 0])
     
     # At threshold gets black (uses >), above threshold gets white
     assert corner_at == (0, 0, 0), "At threshold should get black padding (uses >)"
@@ -391,15 +428,89 @@ def test_adaptive_padding_size_correctness(create_test_image):
     original_width, original_height = 200, 150
     img = create_test_image(width=original_width, height=original_height)
     
-    padded = _add_adaptive_padding(img, PADDING_SIZE)
+    padded = _add_adaptive_padding_array(np.array(img), PADDING_SIZE)
     
     # Check dimensions increased by 2*PADDING_SIZE
-    assert padded.size[0] == original_width + 2 * PADDING_SIZE
-    assert padded.size[1] == original_height + 2 * PADDING_SIZE
+    assert padded.shape[1] == original_width + 2 * PADDING_SIZE
+    assert padded.shape[0] == original_height + 2 * PADDING_SIZE
     
     logger.debug(f"Padding correctly added {PADDING_SIZE}px on all sides")
 
 
+def test_adaptive_padding_large_image_uses_sampled_brightness(create_test_image):
+    """
+    Verify the sampled brightness still picks the majority tone of a large,
+    non-uniform image.
+    """
+    width, height = BRIGHTNESS_SAMPLE_SIZE * 20, BRIGHTNESS_SAMPLE_SIZE * 15
+    img = create_test_image(width=width, height=height, color=(0, 0, 0))
+    # Bright band over the left fifth only: mean stays well below threshold
+    img.paste((255, 255, 255), (0, 0, width // 5, height))
+    
+    padded = _add_adaptive_padding_array(np.array(img), PADDING_SIZE)
+    
+    assert padded.shape == (height + 2 * PADDING_SIZE, width + 2 * PADDING_SIZE, 3)
+    assert tuple(padded[0, 0]) == (0, 0, 0)
+
+
+@pytest.mark.parametrize("raw_value", ["0", "-5"])
+def test_brightness_sample_size_clamped_to_one(monkeypatch, raw_value):
+    """
+    Verify a zero or negative PREPROCESSING_BRIGHTNESS_SAMPLE_SIZE is clamped
+    to 1 instead of breaking the sampling stride.
+    """
+    from .. import config
+    
+    monkeypatch.setenv("PREPROCESSING_BRIGHTNESS_SAMPLE_SIZE", raw_value)
+    try:
+        importlib.reload(config)
+        assert config.BRIGHTNESS_SAMPLE_SIZE == 1
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
+    
+    monkeypatch.setattr(image_preprocessing, "BRIGHTNESS_SAMPLE_SIZE", 1)
+    img = np.full((40, 30, 3), 255, dtype=np.uint8)
+    padded = _add_adaptive_padding_array(img, PADDING_SIZE)
+    assert tuple(padded[0, 0]) == (255, 255, 255)
+
+
+@pytest.mark.skipif(not CV2_AVAILABLE, reason="opencv-python not installed")
+def test_upscale_small_array_matches_pil_size(create_test_image):
+    """
+    Verify the OpenCV upscale produces the same size as the PIL step and
+    leaves large-enough arrays untouched.
+    """
+    img = create_test_image(width=MIN_UPSCALE_DIM - 100, height=MIN_UPSCALE_DIM + 100)
+    arr = np.array(img)
+    
+    upscaled = _upscale_small_array(arr, MIN_UPSCALE_DIM)
+    
+    assert upscaled.shape[1::-1] == _upscale_small_image(img, MIN_UPSCALE_DIM).size
+    assert upscaled.dtype == np.uint8
+    
+    large = np.zeros((MIN_UPSCALE_DIM, MIN_UPSCALE_DIM, 3), dtype=np.uint8)
+    assert _upscale_small_array(large, MIN_UPSCALE_DIM) is large
+
+
+@pytest.mark.skipif(not CV2_AVAILABLE, reason="opencv-python not installed")
+def test_enhance_contrast_sharpness_array_matches_pil(gradient_image):
+    """
+    Verify the fused OpenCV pass matches ImageEnhance.Contrast followed by
+    ImageEnhance.Sharpness (interior pixels; PIL leaves the one-pixel border
+    unfiltered, and the fused pass skips the intermediate rounding).
+    """
+    expected = np.asarray(
+        _enhance_sharpness(_enhance_contrast(gradient_image, 1.3), 1.2),
+        dtype=np.int16
+    )
+    result = _enhance_contrast_sharpness_array(np.array(gradient_image), 1.3, 1.2)
+    
+    assert result.dtype == np.uint8
+    assert result.shape == expected.shape
+    assert np.abs(result.astype(np.int16) - expected)[1:-1, 1:-1].max() <= 2
+
+
 # ============================================================================
 # ARRAY CONVERSION & VALIDATION TESTS
 # ============================================================================